@@ -31,7 +31,8 @@ PRINT_SETTINGS = {
 # UI settings
 UI_SETTINGS = {
     'camera_preview_size': (960, 720),
-    'font_size': 12
+    'font_size': 12,
+    'pixmap_cache_limit_kb': 64 * 1024
 }
 
 # Database settings
@@ -56,10 +57,12 @@ else:
 BACKGROUNDS_DIR = os.path.join(ASSETS_DIR, 'backgrounds')
 TEMPLATES_DIR = os.path.join(ASSETS_DIR, 'templates')
 ICONS_DIR = os.path.join(ASSETS_DIR, 'icons')
+STYLES_DIR = os.path.join(ASSETS_DIR, 'styles')
 TEMP_DIR = os.path.join(BASE_DIR, 'temp')
 CAPTURES_DIR = os.path.join(TEMP_DIR, 'captures')
 PROCESSED_DIR = os.path.join(TEMP_DIR, 'processed')
 DATA_DIR = os.path.join(BASE_DIR, 'data')
+LOG_FILE = os.path.join(TEMP_DIR, 'app.log')
 
 # Pastikan hanya direktori yang dapat ditulis yang dibuat.
 # Direktori assets/templates/icons dibundel saat packaging dan tidak perlu dibuat.
@@ -6,13 +6,14 @@ import sys
 import os
 from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtGui import QIcon, QFont, QPixmapCache
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import APP_NAME, APP_VERSION, UI_SETTINGS
 from modules.session_manager import session_manager
+from utils.logging_utils import setup_logging, shutdown_logging
 
 
 class IDCardPhotoApp:
@@ -22,6 +23,8 @@ class IDCardPhotoApp:
         self.app = QApplication(sys.argv)
         self.app.setApplicationName(APP_NAME)
         self.app.setApplicationVersion(APP_VERSION)
+        # Room for the decoded instructions image plus its scaled variants (in KB)
+        QPixmapCache.setCacheLimit(UI_SETTINGS['pixmap_cache_limit_kb'])
 
         # Application state
         self.current_window = None
@@ -267,16 +270,17 @@ class IDCardPhotoApp:
         """Show dashboard window"""
         try:
             if self.dashboard_window:
-                # If dashboard window exists, just show it
+                # If dashboard window exists, reuse its widget tree and only refresh the user
+                # info, before showing so the first frame already has the current user
+                self.dashboard_window.set_session_info(session_manager.get_current_user())
                 self.dashboard_window.show()
                 self.dashboard_window.raise_()  # Bring to front
                 self.dashboard_window.activateWindow()  # Activate window
-                # Update user info in existing window with current session data
-                self.dashboard_window.set_session_info(session_manager.get_current_user())
             else:
                 # Create new dashboard window (lazy import)
                 from ui.dashboard_window import DashboardWindow
-                self.dashboard_window = DashboardWindow()
+                # The window is shown once below, already in its fullscreen state
+                self.dashboard_window = DashboardWindow(auto_show=False)
                 self.dashboard_window.start_photo_capture.connect(self.show_camera_window)
                 self.dashboard_window.logout_requested.connect(self.logout)
                 # Pass session information to dashboard window
@@ -477,6 +481,7 @@ class IDCardPhotoApp:
                 self.camera_window.show()
                 self.camera_window.raise_()  # Bring to front
                 self.camera_window.activateWindow()  # Activate window
+                self.camera_window.reload_config()  # Pick up admin setting changes
                 self.camera_window.setup_camera()  # Restart camera
                 # Update user info in existing window with current session data
                 self.camera_window.set_session_info(session_manager.get_current_user())
@@ -793,6 +798,7 @@ def check_dependencies():
 def main():
     """Main entry point"""
     print(f"Starting {APP_NAME} v{APP_VERSION}")
+    setup_logging()
 
     # Check dependencies
     if not check_dependencies():
@@ -812,6 +818,7 @@ def main():
         exit_code = 1
     finally:
         app.cleanup()
+        shutdown_logging()
 
     print(f"{APP_NAME} exited with code {exit_code}")
     sys.exit(exit_code)
@@ -3,6 +3,9 @@ Camera Manager Module
 Handles camera detection, preview, and photo capture functionality
 """
 import cv2
+import logging
+import math
+import queue
 import time
 import os
 from datetime import datetime
@@ -11,15 +14,40 @@ from PyQt6.QtGui import QImage, QPixmap
 import numpy as np
 from config import CAMERA_SETTINGS, CAPTURES_DIR
 
+logger = logging.getLogger(__name__)
+
+
+def fit_size(width, height, target_size):
+    """Return the largest (width, height) inside target_size that keeps the aspect ratio"""
+    target_width, target_height = target_size
+    scale = min(target_width / width, target_height / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def orient_frame(frame):
+    """Rotate a raw camera frame to portrait and mirror it like a selfie"""
+    frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+    return cv2.flip(frame, 1)
+
 
 class CameraThread(QThread):
     """Thread for handling camera operations"""
     frame_ready = pyqtSignal(np.ndarray)
 
-    def __init__(self, camera_index=0, backend=cv2.CAP_ANY):
+    def __init__(self, camera_index=0, backend=cv2.CAP_ANY, preview_size=None, preview_pool=None,
+                 preview_queue=None):
         super().__init__()
         self.camera_index = camera_index
         self.backend = backend
+        self.preview_size = preview_size
+        # Free preview buffers; one goes back here only once no queued image wraps it any more
+        self.preview_pool = preview_pool if preview_pool is not None else queue.Queue()
+        # Holds only the newest (buffer, image) pair; the GUI polls it instead of queuing signals
+        self.preview_queue = preview_queue if preview_queue is not None else queue.Queue(maxsize=1)
+        self._scratch_buffers = None
+        # Points into the frame ring, so it is only read through snapshot_raw_frame()
+        self._latest_raw_frame = None
+        self._frame_lock = QMutex()
         self.camera = None
         self.running = False
         self.camera_initialized = False
@@ -134,27 +162,31 @@ class CameraThread(QThread):
 
             self.camera_initialized = True
             self.running = True
+            # Ring buffer for raw frames so read() decodes into existing memory instead of allocating
+            frame_ring = None
+            ring_index = 0
 
             while self.running:
                 if not self.camera or not self.camera.isOpened():
                     print(f"Koneksi kamera {self.camera_index} terputus.")
                     break
 
-                ret, frame = self.camera.read()
+                if frame_ring is None:
+                    ret, frame = self.camera.read()
+                    if ret and frame is not None:
+                        frame_ring = [np.empty_like(frame) for _ in range(3)]
+                else:
+                    ret, frame = self.camera.read(frame_ring[ring_index])
+                    ring_index = (ring_index + 1) % len(frame_ring)
 
                 if ret and frame is not None:
-                    # Flip frame secara horizontal untuk efek cermin
-                    # frame = cv2.flip(frame, 1)
-                    # self.frame_ready.emit(frame)
-
-                    # --- TAMBAHKAN DI SINI: Rotasi 90 derajat (portrait) ---
-                    frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-
-                    # Opsional: flip horizontal agar mirror (seperti selfie)
-                    frame = cv2.flip(frame, 1)
-
-                    # Emit frame yang sudah portrait
-                    self.frame_ready.emit(frame)
+                    if self.preview_size:
+                        # Mode pratinjau: perkecil dulu, rotasi resolusi penuh hanya saat capture
+                        self._set_latest_raw_frame(frame)
+                        self._publish_preview(self._build_preview_image(frame))
+                    else:
+                        # Emit frame yang sudah portrait (rotasi 90 derajat + mirror)
+                        self.frame_ready.emit(orient_frame(frame))
                 else:
                     # Jika gagal membaca frame, tunggu sejenak dan coba lagi sebelum berhenti
                     print(f"Peringatan: Gagal membaca frame dari kamera {self.camera_index}. Mencoba lagi...")
@@ -173,6 +205,79 @@ class CameraThread(QThread):
             print(f"Thread kamera untuk {self.camera_index} berakhir.")
             self._cleanup_camera()
 
+    def _set_latest_raw_frame(self, frame):
+        """Publish the newest ring slot; waits while another thread is copying the previous one"""
+        self._frame_lock.lock()
+        try:
+            self._latest_raw_frame = frame
+        finally:
+            self._frame_lock.unlock()
+
+    def snapshot_raw_frame(self):
+        """Return a private copy of the newest raw frame, or None
+
+        The ring has three slots and the published one is never the slot being read into, so
+        holding the lock for the copy keeps the slot from being reused until the copy is done.
+        """
+        self._frame_lock.lock()
+        try:
+            if self._latest_raw_frame is None:
+                return None
+            return self._latest_raw_frame.copy()
+        finally:
+            self._frame_lock.unlock()
+
+    def _build_preview_image(self, frame):
+        """Scale, orient and convert a raw frame into the off-screen preview buffer"""
+        height, width = frame.shape[:2]
+        # The raw frame is rotated afterwards, so fit its transposed size to the preview
+        portrait_width, portrait_height = fit_size(height, width, self.preview_size)
+        shape = (portrait_height, portrait_width, 3)
+        # BGRA byte order matches Qt's little-endian RGB32, which pixmaps use without converting
+        display_shape = (portrait_height, portrait_width, 4)
+        if self._scratch_buffers is None or self._scratch_buffers[1].shape != shape:
+            self._scratch_buffers = (
+                np.empty((portrait_width, portrait_height, 3), np.uint8),
+                np.empty(shape, np.uint8),
+                np.empty(shape, np.uint8),
+            )
+
+        scaled, rotated, mirrored = self._scratch_buffers
+        cv2.resize(frame, (portrait_height, portrait_width), dst=scaled,
+                   interpolation=cv2.INTER_AREA)
+        cv2.rotate(scaled, cv2.ROTATE_90_CLOCKWISE, dst=rotated)
+        cv2.flip(rotated, 1, dst=mirrored)
+
+        buffer = self._take_preview_buffer(display_shape)
+        cv2.cvtColor(mirrored, cv2.COLOR_BGR2BGRA, dst=buffer)
+        # No copy: the image wraps the buffer, so the two travel together and the buffer is
+        # only reused after the consumer hands it back to the pool
+        image = QImage(buffer.data, portrait_width, portrait_height, portrait_width * 4,
+                       QImage.Format.Format_RGB32)
+        return buffer, image
+
+    def _take_preview_buffer(self, shape):
+        """Return a free preview buffer of the given shape, allocating one if none is free"""
+        while True:
+            try:
+                buffer = self.preview_pool.get_nowait()
+            except queue.Empty:
+                return np.empty(shape, np.uint8)
+            # Buffers from before a preview size change are dropped, not rewritten
+            if buffer.shape == shape:
+                return buffer
+
+    def _publish_preview(self, preview):
+        """Replace any preview image the GUI hasn't picked up yet"""
+        try:
+            stale_buffer, _ = self.preview_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            # The GUI never saw the replaced image, so its buffer is free again
+            self.preview_pool.put_nowait(stale_buffer)
+        self.preview_queue.put_nowait(preview)
+
     def stop(self):
         """Stop camera thread safely"""
         print(f"Stopping camera thread for camera {self.camera_index}")
@@ -212,13 +317,39 @@ class CameraManager:
     """Main camera management class"""
 
     def __init__(self):
+        self._available_cameras = []
+        self._camera_index = []
         self.available_cameras = self.detect_cameras()
         self.current_camera_index = 0
         self.camera_thread = None
         self.current_frame = None
+        # Owned here so preview buffers survive a camera thread restart
+        self._preview_pool = queue.Queue()
+        self._preview_queue = queue.Queue(maxsize=1)
+        # (buffer, image) currently on screen; the pixmap may share the buffer's memory
+        self._displayed_preview = None
+        self._preview_callback = None
+        self._display_timer = None
         self.captured_photos = []
         self.capture_count = CAMERA_SETTINGS['capture_count']
 
+    @property
+    def available_cameras(self):
+        return self._available_cameras
+
+    @available_cameras.setter
+    def available_cameras(self, cameras):
+        # Lowercase names are computed once per detection instead of on every lookup
+        self._available_cameras = cameras
+        self._camera_index = [(camera['name'].lower(), i, camera) for i, camera in enumerate(cameras)]
+
+    def find_by_substring(self, needle_lower):
+        """Return (position, camera) of the first camera whose lowercase name contains needle_lower"""
+        for name_lower, i, camera in self._camera_index:
+            if needle_lower in name_lower:
+                return i, camera
+        return None
+
     def detect_cameras(self):
         """Detect all available cameras"""
         cameras = []
@@ -373,8 +504,12 @@ class CameraManager:
     #     self.camera_thread.start()
     # Di dalam kelas CameraManager (file modules/camera_manager.py)
 
-    def start_preview(self, frame_callback=None):
-        """Start camera preview"""
+    def start_preview(self, frame_callback=None, preview_size=None):
+        """Start camera preview
+
+        When preview_size is given the callback receives a QImage already scaled
+        to fit it, otherwise it receives the raw frame.
+        """
         if self.camera_thread and self.camera_thread.isRunning():
             self.stop_preview()
 
@@ -386,12 +521,41 @@ class CameraManager:
             # Fallback jika tidak ada kamera terpilih
             return
 
-        self.camera_thread = CameraThread(camera_index, backend)
+        self.camera_thread = CameraThread(camera_index, backend, preview_size, self._preview_pool,
+                                          self._preview_queue)
         if frame_callback:
-            self.camera_thread.frame_ready.connect(frame_callback)
-        self.camera_thread.frame_ready.connect(self._update_current_frame)
+            if preview_size:
+                self.attach_preview(frame_callback, preview_size)
+            else:
+                self.camera_thread.frame_ready.connect(frame_callback)
+        if not preview_size:
+            # Preview mode never emits frame_ready; captures fall back to snapshot_raw_frame there
+            self.camera_thread.frame_ready.connect(self._update_current_frame)
         self.camera_thread.start()
 
+    def attach_preview(self, frame_callback, preview_size):
+        """Deliver the newest scaled preview image to frame_callback at the preview rate"""
+        self._preview_callback = frame_callback
+        if self.camera_thread:
+            self.camera_thread.preview_size = preview_size
+        if self._display_timer is None:
+            self._display_timer = QTimer()
+            self._display_timer.timeout.connect(self._deliver_preview)
+        self._display_timer.start(int(1000 / CAMERA_SETTINGS['preview_fps']))
+
+    def _deliver_preview(self):
+        """Hand the latest preview image, if any, to the preview callback"""
+        try:
+            buffer, image = self._preview_queue.get_nowait()
+        except queue.Empty:
+            return
+        if self._preview_callback:
+            self._preview_callback(image)
+        # Recycle the previous buffer only now that its image has been replaced on screen
+        if self._displayed_preview is not None:
+            self._preview_pool.put_nowait(self._displayed_preview[0])
+        self._displayed_preview = (buffer, image)
+
     def warm_up_camera(self):
         """Buka kamera sebentar untuk pemanasan saat aplikasi dimulai"""
         try:
@@ -434,11 +598,20 @@ class CameraManager:
 
     def stop_preview(self):
         """Stop camera preview"""
+        if self._display_timer:
+            self._display_timer.stop()
+        self._preview_callback = None
         if self.camera_thread:
             print("Stopping camera preview...")
             self.camera_thread.stop()
             self.camera_thread = None
             print("Camera preview stopped")
+        # Drop any image left over so the next session doesn't show a stale frame
+        try:
+            self._preview_queue.get_nowait()
+        except queue.Empty:
+            pass
+        # _displayed_preview is kept: the label still shows its pixmap until the next session delivers a frame
 
     def _update_current_frame(self, frame):
         """Update current frame for capture"""
@@ -446,30 +619,55 @@ class CameraManager:
 
     def capture_photo(self, save_path=None):
         """Capture a single photo with fresh frame"""
-        # Get a fresh frame directly from camera for better real-time capture
-        fresh_frame = self._capture_fresh_frame()
-        if fresh_frame is None:
-            # Fallback to current frame if fresh capture fails
-            if self.current_frame is None:
-                return None
-            fresh_frame = self.current_frame
+        frame = self.grab_raw()
+        if frame is None:
+            return None
 
         if save_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-            save_path = os.path.join(CAPTURES_DIR, f"capture_{timestamp}.jpg")
+            save_path = self.new_capture_path()
+        return self.save_frame(frame, save_path)
 
+    def grab_raw(self):
+        """Grab a fresh full-resolution frame, falling back to the latest preview frame"""
+        # Get a fresh frame directly from camera for better real-time capture
+        frame = self._capture_fresh_frame()
+        if frame is None:
+            frame = self._latest_frame()
+        return frame
+
+    def new_capture_path(self):
+        """Return a unique path in the captures directory for a new photo"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        return os.path.join(CAPTURES_DIR, f"capture_{timestamp}.jpg")
+
+    def save_frame(self, frame, save_path):
+        """Encode a frame as JPEG and write it to save_path"""
         # Ensure directory exists
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
-        # Save the fresh image
-        success = cv2.imwrite(save_path, fresh_frame,
-                             [cv2.IMWRITE_JPEG_QUALITY, CAMERA_SETTINGS['capture_quality']])
-
+        # Encode in memory and write the bytes in one call instead of going through imwrite's file I/O
+        success, encoded = cv2.imencode('.jpg', frame, [
+            cv2.IMWRITE_JPEG_QUALITY, CAMERA_SETTINGS['capture_quality'],
+        ])
         if success:
+            try:
+                with open(save_path, 'wb') as output:
+                    output.write(encoded.tobytes())
+            except OSError as e:
+                # imwrite reported write failures by returning False; callers still expect None
+                logger.error("Gagal menyimpan foto %s: %s", save_path, e)
+                return None
             print(f"Captured fresh photo: {os.path.basename(save_path)}")
             return save_path
         return None
 
+    def _latest_frame(self):
+        """Return the most recent full-resolution frame seen by the preview"""
+        raw_frame = self.camera_thread.snapshot_raw_frame() if self.camera_thread else None
+        if raw_frame is not None:
+            return orient_frame(raw_frame)
+        return self.current_frame
+
     def _capture_fresh_frame(self):
         """Capture a fresh frame directly from camera"""
         if not self.camera_thread or not self.camera_thread.camera or not self.camera_thread.camera_initialized:
@@ -491,10 +689,9 @@ class CameraManager:
                         return None
 
                 # Apply same processing as in camera thread
-                frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE) # Rotate
-                frame = cv2.flip(frame, 1)  # Mirror effect
+                frame = orient_frame(frame)
                 print("Captured fresh frame from camera")
-                return frame.copy()
+                return frame
 
             finally:
                 self.camera_thread._lock.unlock()
@@ -547,19 +744,16 @@ class CameraManager:
 
     def frame_to_qpixmap(self, frame, size=None, maintain_aspect_ratio=False):
         """Convert OpenCV frame to QPixmap"""
-        qt_image = self.frame_to_qimage(frame)
-        pixmap = QPixmap.fromImage(qt_image)
-
-        if size:
+        if size and size[0] > 0 and size[1] > 0:
+            height, width = frame.shape[:2]
             if maintain_aspect_ratio:
-                # Scale while maintaining aspect ratio
-                from PyQt6.QtCore import Qt
-                pixmap = pixmap.scaled(size[0], size[1], Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                target_size = fit_size(width, height, size)
             else:
-                pixmap = pixmap.scaled(size[0], size[1])
-
-        return pixmap
+                target_size = (int(size[0]), int(size[1]))
+            # Scale in OpenCV first so only display-sized pixels are converted and uploaded
+            frame = cv2.resize(frame, target_size, interpolation=cv2.INTER_AREA)
 
+        return QPixmap.fromImage(self.frame_to_qimage(frame))
 
     def get_camera_info(self):
         """Get current camera information"""
@@ -598,7 +792,17 @@ class CaptureTimer(QThread):
 
     def run(self):
         """Run countdown timer"""
-        for i in range(self.countdown_seconds, 0, -1):
-            self.countdown_update.emit(i)
-            self.sleep(1)
+        # Remaining seconds come from a fixed monotonic deadline and are only emitted when they change
+        deadline = time.monotonic() + self.countdown_seconds
+        last_remaining = None
+        while True:
+            if self.isInterruptionRequested():
+                return
+            remaining = math.ceil(deadline - time.monotonic())
+            if remaining <= 0:
+                break
+            if remaining != last_remaining:
+                self.countdown_update.emit(remaining)
+                last_remaining = remaining
+            self.msleep(100)
         self.capture_ready.emit()
@@ -389,6 +389,18 @@ class DatabaseManager:
         results = self.execute_query("SELECT value FROM app_configs WHERE name = ?", (name,))
         return results[0]['value'] if results else None
 
+    def get_app_configs(self, names: List[str]) -> Dict[str, Optional[str]]:
+        """Get several application configuration values in a single query"""
+        configs = {name: None for name in names}
+        if not names:
+            return configs
+        placeholders = ", ".join("?" for _ in names)
+        results = self.execute_query(
+            f"SELECT name, value FROM app_configs WHERE name IN ({placeholders})", tuple(names)
+        )
+        configs.update({row['name']: row['value'] for row in results})
+        return configs
+
     def set_app_config(self, name: str, value: str) -> bool:
         """Set application configuration value"""
         try:
@@ -18,7 +18,7 @@ from PyQt6.QtCore import QTimer
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import CAMERA_SETTINGS, CAPTURES_DIR, UI_SETTINGS
-from modules.camera_manager import CameraManager
+from modules.camera_manager import CameraManager, fit_size
 from modules.database import db_manager
 from modules.session_manager import session_manager
 
@@ -209,6 +209,7 @@ class MockCameraManager(CameraManager):
         self._fps = max(1, fps)
         self._preview_timer: QTimer | None = None
         self._frame_callback = None
+        self._preview_size = None
         self._tick = 0
         super().__init__()
         self.available_cameras = list(self._mock_cameras)
@@ -219,10 +220,11 @@ class MockCameraManager(CameraManager):
         """Lewati deteksi hardware dan gunakan konfigurasi mock."""
         return list(self._mock_cameras)
 
-    def start_preview(self, frame_callback=None):
+    def start_preview(self, frame_callback=None, preview_size=None):
         """Mulai timer yang memancarkan frame simulasi."""
         self.stop_preview()
         self._frame_callback = frame_callback
+        self._preview_size = preview_size
         if self._preview_timer is None:
             self._preview_timer = QTimer()
             self._preview_timer.timeout.connect(self._emit_frame)
@@ -255,7 +257,14 @@ class MockCameraManager(CameraManager):
         self.current_frame = frame
 
         if self._frame_callback:
-            self._frame_callback(frame.copy())
+            if self._preview_size:
+                # Samakan dengan CameraThread: kirim QImage yang sudah diskalakan
+                height, width = frame.shape[:2]
+                preview = cv2.resize(frame, fit_size(width, height, self._preview_size),
+                                     interpolation=cv2.INTER_AREA)
+                self._frame_callback(self.frame_to_qimage(preview).copy())
+            else:
+                self._frame_callback(frame.copy())
 
         self._tick += 1
 
@@ -3,7 +3,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QGridLayout, QFrame, QDialog,
     QLineEdit, QComboBox, QSpinBox, QFileDialog, QMessageBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QColor, QPainter, QPalette
 import logging
 import sys
 from config import APP_NAME
@@ -11,9 +12,119 @@ from modules.database import db_manager
 from modules.camera_manager import CameraManager
 from modules.print_manager import PrintManager
 from ui.dialogs.custom_dialog import CustomStyledDialog
+from utils.ui_utils import load_stylesheet
 
 logger = logging.getLogger(__name__)
 
+# Section rules are scoped to the frame that owns them so widgets elsewhere never match them
+_ADMIN_QSS = load_stylesheet("admin.qss")
+_SECTION_QSS = load_stylesheet("admin_section.qss")
+_SECTION_FUNCTION_QSS = _SECTION_QSS + load_stylesheet("admin_function_section.qss")
+_SECTION_INFO_QSS = _SECTION_QSS + load_stylesheet("admin_info_section.qss")
+
+# Admin dialogs use larger text than ui.dialogs.custom_dialog, so they keep their own sheet
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #FFFFFF;
+        color: #333333;
+    }
+    QLabel {
+        background-color: #FFFFFF;
+        color: #333333;
+        font-size: 16px;
+        padding: 10px;
+    }
+    QPushButton {
+        background-color: #E60012;
+        color: #FFFFFF;
+        font-weight: bold;
+        font-size: 16px;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #CC0010;
+    }
+    QPushButton:pressed {
+        background-color: #99000C;
+    }
+    QPushButton#cancelButton {
+        background-color: #6c757d;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #5a6268;
+    }
+    QPushButton#cancelButton:pressed {
+        background-color: #495057;
+    }
+"""
+
+# Normal, hover and pressed fills plus corner radius for each admin button type
+_BUTTON_COLORS = {
+    "HeaderButton": ("#007BFF", "#0056B3", "#0056B3", 6),
+    "LogoutButton": ("#555555", "#333333", "#333333", 6),
+    "FunctionButton": ("#E60012", "#CC0010", "#99000C", 8),
+    "InfoRefreshButton": ("#E60012", "#CC0010", "#99000C", 8),
+}
+
+
+class PaletteButton(QPushButton):
+    """Button that swaps pre-built palettes on hover/press instead of QSS pseudostates"""
+
+    def __init__(self, text, palettes, radius, parent=None):
+        super().__init__(text, parent)
+        self._normal_palette, self._hover_palette, self._pressed_palette = palettes
+        self._radius = radius
+
+    def _apply_state_palette(self):
+        if self.isDown():
+            palette = self._pressed_palette
+        elif self.underMouse():
+            palette = self._hover_palette
+        else:
+            palette = self._normal_palette
+        # Skipping an unchanged palette keeps changeEvent from looping on its own PaletteChange
+        if self.palette() != palette:
+            self.setPalette(palette)
+
+    def showEvent(self, event):
+        # Polishing resets the button role from the stylesheet, so re-apply after it
+        self._apply_state_palette()
+        super().showEvent(event)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # A sheet set on an ancestor after show re-polishes the button and overrides its palette
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.PaletteChange):
+            self._apply_state_palette()
+
+    def enterEvent(self, event):
+        self.setPalette(self._hover_palette)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.setPalette(self._normal_palette)
+        super().leaveEvent(event)
+
+    def mousePressEvent(self, event):
+        super().mousePressEvent(event)
+        self._apply_state_palette()
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        self._apply_state_palette()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.palette().color(QPalette.ColorRole.Button))
+        painter.drawRoundedRect(self.rect(), self._radius, self._radius)
+        painter.end()
+        super().paintEvent(event)
+
 
 class CustomStyledDialog(QDialog):
     """Custom dialog with consistent styling matching the logout confirmation"""
@@ -23,7 +134,9 @@ class CustomStyledDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setModal(True)
-        self.setFixedSize(400, 200)
+        self.setSizeGripEnabled(False)
+        self.setMinimumWidth(400)
+        self.setMaximumWidth(640)
 
         # Main layout
         layout = QVBoxLayout(self)
@@ -44,57 +157,36 @@ class CustomStyledDialog(QDialog):
             buttons = [("OK", QDialog.DialogCode.Accepted)]
 
         self.buttons = []
+        # One bound slot serves every button; the clicked button's role is looked up by sender
+        self._button_roles = {}
         for text, role in buttons:
             btn = QPushButton(text)
-            btn.clicked.connect(lambda checked, r=role: self.done(r))
+            self._button_roles[btn] = role
+            btn.clicked.connect(self._on_button_clicked)
             button_layout.addWidget(btn)
             self.buttons.append(btn)
 
         layout.addLayout(button_layout)
 
         # Apply consistent styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-                color: #333333;
-            }
-            QLabel {
-                background-color: #FFFFFF;
-                color: #333333;
-                font-size: 16px;
-                padding: 10px;
-            }
-            QPushButton {
-                background-color: #E60012;
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 16px;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #CC0010;
-            }
-            QPushButton:pressed {
-                background-color: #99000C;
-            }
-            QPushButton#cancelButton {
-                background-color: #6c757d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton#cancelButton:pressed {
-                background-color: #495057;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
+        # Let the layout pick the height for the message instead of a fixed box
+        self.adjustSize()
+
+    @pyqtSlot()
+    def _on_button_clicked(self):
+        """Close the dialog with the role of the button that was clicked"""
+        self.done(self._button_roles[self.sender()])
 
     def set_cancel_button(self, button_index=0):
         """Set a button as cancel button for different styling"""
         if 0 <= button_index < len(self.buttons):
-            self.buttons[button_index].setObjectName("cancelButton")
+            button = self.buttons[button_index]
+            button.setObjectName("cancelButton")
+            # Re-polish so the dialog sheet's #cancelButton rules pick up the new name
+            button.style().unpolish(button)
+            button.style().polish(button)
+
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -455,8 +547,8 @@ class SettingsDialog(QDialog):
             maintain_aspect_ratio=True,
         )
         if pixmap:
+            # setPixmap already clears the placeholder text
             self.camera_preview_label.setPixmap(pixmap)
-            self.camera_preview_label.setText("")
 
     def stop_camera_preview(self, show_placeholder=True, message=None):
         """Stop running camera preview and optionally show placeholder message"""
@@ -669,15 +761,40 @@ class AdminWindow(QWidget):
     logout_requested = pyqtSignal()
     show_employee_list = pyqtSignal()  # Emit user data on successful login
 
+    STYLESHEET = _ADMIN_QSS
 
     def __init__(self):
         super().__init__()
+        # Only style the window itself when the application doesn't already carry the sheet
+        app = QApplication.instance()
+        if app is None or app.styleSheet() != self.STYLESHEET:
+            self.setStyleSheet(self.STYLESHEET)
+        self._button_palettes = self._build_button_palettes()
         self.init_ui()
         self.load_system_info()
 
+    @staticmethod
+    def _build_button_palettes():
+        """Build the normal/hover/pressed palettes for every admin button type once"""
+        palettes = {}
+        for object_name, (*colors, radius) in _BUTTON_COLORS.items():
+            states = []
+            for color in colors:
+                palette = QPalette()
+                palette.setColor(QPalette.ColorRole.Button, QColor(color))
+                states.append(palette)
+            palettes[object_name] = (tuple(states), radius)
+        return palettes
+
+    def create_button(self, text, object_name):
+        """Create a palette-driven admin button for the given object name"""
+        palettes, radius = self._button_palettes[object_name]
+        button = PaletteButton(text, palettes, radius)
+        button.setObjectName(object_name)
+        return button
+
     def init_ui(self):
         self.setWindowTitle("Admin Panel - " + APP_NAME)
-        self.setStyleSheet(self.get_stylesheet())
 
         # Main layout
         main_layout = QVBoxLayout()
@@ -690,12 +807,11 @@ class AdminWindow(QWidget):
 
         # Settings and Logout buttons in header
         header_btn_layout = QHBoxLayout()
-        settings_btn = QPushButton("⚙️ Pengaturan")
-        settings_btn.setObjectName("HeaderButton")
+        header_btn_layout.setSpacing(10)
+        settings_btn = self.create_button("⚙️ Pengaturan", "HeaderButton")
         settings_btn.clicked.connect(self.show_settings)
 
-        logout_btn = QPushButton("Keluar")
-        logout_btn.setObjectName("LogoutButton")
+        logout_btn = self.create_button("Keluar", "LogoutButton")
         logout_btn.clicked.connect(self.handle_logout)
 
         header_btn_layout.addWidget(settings_btn)
@@ -708,6 +824,7 @@ class AdminWindow(QWidget):
         # Employee Management Section
         employee_frame = QFrame()
         employee_frame.setObjectName("SectionFrame")
+        employee_frame.setStyleSheet(_SECTION_FUNCTION_QSS)
         employee_layout = QVBoxLayout()
 
         employee_title = QLabel("📋 Manajemen Karyawan")
@@ -715,28 +832,29 @@ class AdminWindow(QWidget):
 
         # Employee management buttons grid
         employee_grid = QGridLayout()
+        employee_grid.setContentsMargins(5, 5, 5, 5)
 
         # Row 1
-        self.show_list_btn = QPushButton("📄 Tampilkan Daftar Data Karyawan")
-        self.show_list_btn.setObjectName("FunctionButton")
+        self.show_list_btn = self.create_button("📄 Tampilkan Daftar Data Karyawan", "FunctionButton")
         self.show_list_btn.clicked.connect(self.handle_show_list)
 
         employee_grid.addWidget(self.show_list_btn, 0, 0)
 
         employee_layout.addWidget(employee_title)
+        employee_layout.addSpacing(15)
         employee_layout.addLayout(employee_grid)
         employee_frame.setLayout(employee_layout)
 
         # System Information Section
         system_frame = QFrame()
         system_frame.setObjectName("SectionFrame")
+        system_frame.setStyleSheet(_SECTION_INFO_QSS)
         system_layout = QVBoxLayout()
 
         system_title = QLabel("📊 Informasi Sistem")
         system_title.setObjectName("SectionTitle")
 
-        self.refresh_info_btn = QPushButton("🔄 Muat Ulang Data")
-        self.refresh_info_btn.setObjectName("InfoRefreshButton")
+        self.refresh_info_btn = self.create_button("🔄 Muat Ulang Data", "InfoRefreshButton")
         self.refresh_info_btn.clicked.connect(self.load_system_info)
 
         # System info display area
@@ -773,6 +891,7 @@ class AdminWindow(QWidget):
             self.info_value_labels[key] = value_label
 
         system_layout.addWidget(system_title)
+        system_layout.addSpacing(15)
         refresh_layout = QHBoxLayout()
         refresh_layout.addStretch()
         refresh_layout.addWidget(self.refresh_info_btn)
@@ -782,6 +901,7 @@ class AdminWindow(QWidget):
 
         # Add everything to main layout
         main_layout.addLayout(header_layout)
+        main_layout.addSpacing(10)
         main_layout.addWidget(employee_frame)
         main_layout.addWidget(system_frame)
         main_layout.addStretch()
@@ -839,150 +959,13 @@ class AdminWindow(QWidget):
             logger.error("Gagal memuat ringkasan sistem: %s", exc)
         return 0
 
-    def get_stylesheet(self):
-        return """
-        QWidget {
-            background-color: #F5F5F5;
-        }
-
-        #TitleLabel {
-            color: #E60012;
-            font-size: 28px;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-
-        #SectionFrame {
-            background-color: #FFFFFF;
-            border: 2px solid #E60012;
-            border-radius: 12px;
-            margin: 10px 0;
-            padding: 20px;
-        }
-
-        #SectionTitle {
-            color: #E60012;
-            font-size: 20px;
-            font-weight: bold;
-            margin-bottom: 15px;
-        }
-
-        #InfoCard {
-            background-color: #FFFFFF;
-            border: 2px solid #E60012;
-            border-radius: 16px;
-        }
-
-        #InfoCardTitle {
-            color: #333333;
-            font-size: 18px;
-            font-weight: 600;
-            letter-spacing: 0.5px;
-        }
-
-        #InfoCardValue {
-            color: #E60012;
-            font-size: 40px;
-            font-weight: 800;
-        }
-
-        #InfoRefreshButton {
-            background-color: #E60012;
-            color: #FFFFFF;
-            font-weight: bold;
-            font-size: 16px;
-            border-radius: 8px;
-            padding: 12px 24px;
-        }
-        #InfoRefreshButton:hover {
-            background-color: #CC0010;
-        }
-        #InfoRefreshButton:pressed {
-            background-color: #99000C;
-        }
-
-        #FunctionButton {
-            background-color: #E60012;
-            color: #FFFFFF;
-            font-weight: bold;
-            font-size: 20px;
-            border: none;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 5px;
-            min-height: 60px;
-        }
-        #FunctionButton:hover {
-            background-color: #CC0010;
-        }
-        #FunctionButton:pressed {
-            background-color: #99000C;
-        }
-
-        #DeleteButton {
-            background-color: #DC3545;
-            color: #FFFFFF;
-            font-weight: bold;
-            font-size: 16px;
-            border: none;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 5px;
-            min-height: 50px;
-        }
-        #DeleteButton:hover {
-            background-color: #C82333;
-        }
-        #DeleteButton:pressed {
-            background-color: #A71D2A;
-        }
-
-        #HeaderButton {
-            background-color: #007BFF;
-            color: #FFFFFF;
-            font-weight: bold;
-            font-size: 14px;
-            border: none;
-            border-radius: 6px;
-            padding: 8px 16px;
-            margin-left: 5px;
-        }
-        #HeaderButton:hover {
-            background-color: #0056B3;
-        }
-
-        #LogoutButton {
-            background-color: #555555;
-            color: #FFFFFF;
-            font-weight: bold;
-            font-size: 14px;
-            border: none;
-            border-radius: 6px;
-            padding: 8px 16px;
-            margin-left: 5px;
-        }
-        #LogoutButton:hover {
-            background-color: #333333;
-        }
-
-        #InfoLabel {
-            color: #666666;
-            font-weight: bold;
-            font-size: 14px;
-            margin: 5px;
-        }
-
-        #InfoValue {
-            color: #E60012;
-            font-weight: bold;
-            font-size: 14px;
-            margin: 5px;
-        }
-        """
+    @classmethod
+    def get_stylesheet(cls):
+        return cls.STYLESHEET
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(AdminWindow.get_stylesheet())
     window = AdminWindow()
     window.showFullScreen()  # tampilkan dalam mode full screen
-    window.show()
     sys.exit(app.exec())
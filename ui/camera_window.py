@@ -6,12 +6,16 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QLabel, QPushButton, QComboBox, QGridLayout,
                             QFrame, QProgressBar, QSpinBox, QGroupBox, QDialog,
                             QSizePolicy, QScrollArea)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QUrl
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QUrl, QMutex, QWaitCondition, QEvent
 from PyQt6.QtMultimedia import QSoundEffect
 from PyQt6.QtGui import QPixmap, QFont, QPalette
 import cv2
 import numpy as np
+import logging
+import math
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from modules.camera_manager import CameraManager, CaptureTimer
 from modules.database import db_manager
 from modules.session_manager import session_manager
@@ -19,6 +23,78 @@ from config import UI_SETTINGS, CAMERA_SETTINGS, APP_NAME, ASSETS_DIR
 from ui.components.navigation_header import NavigationHeader
 from ui.dialogs.custom_dialog import CustomStyledDialog
 
+logger = logging.getLogger(__name__)
+
+_MODERN_STYLE = """
+    QMainWindow {
+        background-color: #ecf0f1;
+    }
+    QFrame {
+        background-color: white;
+        border-radius: 10px;
+        margin: 5px;
+        padding: 10px;
+    }
+    QGroupBox {
+        font-weight: bold;
+        font-size: 12px;
+        color: #2c3e50;
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #f8f9fa;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #34495e;
+        color: white;
+        font-weight: bold;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        min-height: 20px;
+    }
+    QPushButton:hover {
+        background-color: #2c3e50;
+    }
+    QPushButton:pressed {
+        background-color: #1b2631;
+    }
+    QComboBox {
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: white;
+        color: #2c3e50;
+    }
+    QSpinBox {
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        padding: 5px;
+        background-color: white;
+        color: #2c3e50;
+    }
+    QProgressBar {
+        border: 2px solid #bdc3c7;
+        border-radius: 5px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #3498db;
+        border-radius: 3px;
+    }
+    QLabel {
+        color: #2c3e50;
+        background-color: transparent;
+    }
+"""
+
+
 MALE_PHOTO_SAMPLE_PATH = os.path.join(ASSETS_DIR, "sample_photos", "male.jpg")
 FEMALE_PHOTO_SAMPLE_PATH = os.path.join(ASSETS_DIR, "sample_photos", "female.jpg")
 
@@ -26,7 +102,7 @@ class PhotoCaptureThread(QThread):
     """Thread for capturing multiple photos without blocking UI"""
     photo_captured = pyqtSignal(int, int, str)  # current, total, photo_path
     capture_starting = pyqtSignal(int, int)  # current, total - when about to capture
-    delay_countdown = pyqtSignal(int, int, int)  # current, total, remaining_delay
+    delay_started = pyqtSignal(int, int, int)  # current, total, delay_seconds
     capture_complete = pyqtSignal(list)  # captured_paths
 
     def __init__(self, camera_manager, count, delay):
@@ -34,44 +110,85 @@ class PhotoCaptureThread(QThread):
         self.camera_manager = camera_manager
         self.count = count
         self.delay = delay
+        self._wait_mutex = QMutex()
+        self._wait_condition = QWaitCondition()
+
+    def requestInterruption(self):
+        """Request interruption and wake any pending delay immediately"""
+        super().requestInterruption()
+        self._wait_mutex.lock()
+        self._wait_condition.wakeAll()
+        self._wait_mutex.unlock()
+
+    def cancel(self, timeout_ms=3000):
+        """Cancel the capture sequence and wait for the thread to finish"""
+        self.requestInterruption()
+        return self.wait(timeout_ms)
+
+    def _wait_until(self, deadline):
+        """Wait until the monotonic deadline, returning False if interrupted first"""
+        self._wait_mutex.lock()
+        try:
+            while not self.isInterruptionRequested():
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    return True
+                self._wait_condition.wait(self._wait_mutex, remaining_ms)
+            return False
+        finally:
+            self._wait_mutex.unlock()
 
     def run(self):
         """Capture photos with proper delays"""
-        captured_paths = []
+        # Encoding and writing run in the background so the next countdown starts right away
+        save_pool = ThreadPoolExecutor(max_workers=2)
+        save_jobs = []
 
         try:
             for i in range(self.count):
                 # Check if thread should stop
                 if self.isInterruptionRequested():
-                    print("Photo capture thread interrupted")
+                    logger.info("Photo capture thread interrupted")
                     break
 
                 # Signal that we're about to capture a photo
                 self.capture_starting.emit(i + 1, self.count)
 
                 # Capture photo
-                print(f"Capturing photo {i+1}/{self.count}...")
-                photo_path = self.camera_manager.capture_photo()
-
-                if photo_path:
-                    captured_paths.append(photo_path)
+                logger.debug("Capturing photo %d/%d...", i + 1, self.count)
+                photo_path = None
+                frame = self.camera_manager.grab_raw()
+                if frame is not None:
+                    photo_path = self.camera_manager.new_capture_path()
+                    save_jobs.append(save_pool.submit(self.camera_manager.save_frame, frame, photo_path))
 
                 # Emit progress signal
                 self.photo_captured.emit(i + 1, self.count, photo_path)
 
                 # Wait for delay with countdown AFTER photo is captured (except last photo)
                 if i < self.count - 1:
-                    print(f"Starting {self.delay} second delay after photo {i+1}...")
+                    logger.debug("Starting %d second delay after photo %d...", self.delay, i + 1)
                     # Wait 1 second for capture overlay to be hidden, then start delay countdown
-                    self.sleep(1)
-                    for remaining in range(int(self.delay), 0, -1):
-                        if self.isInterruptionRequested():
-                            break
-                        self.delay_countdown.emit(i + 1, self.count, remaining)
-                        self.sleep(1)  # Sleep for 1 second
+                    if not self._wait_until(time.monotonic() + 1):
+                        continue
+                    # The GUI draws the countdown itself; this thread only waits out the delay
+                    self.delay_started.emit(i + 1, self.count, self.delay)
+                    self._wait_until(time.monotonic() + self.delay)
 
-        except Exception as e:
-            print(f"Error in photo capture thread: {e}")
+        except Exception:
+            logger.exception("Error in photo capture thread")
+
+        # Wait for pending writes so only photos that reached disk are reported
+        save_pool.shutdown(wait=True)
+        captured_paths = []
+        for job in save_jobs:
+            try:
+                saved_path = job.result()
+            except Exception:
+                logger.exception("Error saving captured photo")
+                continue
+            if saved_path:
+                captured_paths.append(saved_path)
 
         # Emit completion signal
         self.capture_complete.emit(captured_paths)
@@ -82,6 +199,29 @@ class MainWindow(QMainWindow):
 
     LEFT_COLUMN_WIDTH = 360
     RIGHT_COLUMN_WIDTH = 420
+    CONFIG_KEYS = ('default_camera', 'photo_count', 'capture_delay')
+
+    _OVERLAY_STYLES = {
+        'countdown': """
+            QLabel {
+                background-color: rgba(0, 0, 0, 150);
+                color: white;
+                font-weight: bold;
+                border-radius: 10px;
+                text-align: center;
+            }
+        """,
+        'capture': """
+            QLabel {
+                background-color: rgba(255, 255, 255, 200);
+                color: #2c3e50;
+                font-weight: bold;
+                border-radius: 10px;
+                text-align: center;
+            }
+        """,
+    }
+    _OVERLAY_STYLES['delay'] = _OVERLAY_STYLES['countdown']
 
     photos_captured = pyqtSignal(list)  # Signal emitted when photos are captured
     logout_requested = pyqtSignal()  # Signal emitted when logout is requested
@@ -97,6 +237,23 @@ class MainWindow(QMainWindow):
         self.current_user = None
         self.tick_sound = None
         self.shutter_sound = None
+        self._camera_cache = None
+        self._config = {}
+        self._delay_timer = QTimer(self)
+        self._delay_timer.setInterval(100)
+        self._delay_timer.timeout.connect(self._update_delay_countdown)
+        self._delay_deadline = 0.0
+        self._delay_photo = (0, 0)
+        self._delay_remaining = None
+        self._counter_fmt = "Foto diambil: {}/{}".format
+        self._last_counter_text = "Foto diambil: 0"
+        # Progress signals are coalesced and painted at most once per frame
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._load_config()
         self.init_ui()
         self._init_sounds()
 
@@ -181,10 +338,29 @@ class MainWindow(QMainWindow):
             print(f"Gagal memuat efek suara {filename}: {e}")
         return None
 
+    def _load_config(self):
+        """Load the settings this window uses from the database in one query"""
+        try:
+            self._config = db_manager.get_app_configs(list(self.CONFIG_KEYS))
+        except Exception:
+            logger.exception("Error loading config")
+            self._config = {}
+
+    def reload_config(self):
+        """Re-read settings that admin may have changed since the last session"""
+        self._load_config()
+        self._camera_cache = None
+        self.photo_count_spin.setValue(
+            int(self.get_config_value('photo_count', CAMERA_SETTINGS['capture_count']))
+        )
+        self.delay_spin.setValue(
+            int(self.get_config_value('capture_delay', CAMERA_SETTINGS['capture_delay']))
+        )
+
     def get_config_value(self, config_name, default_value):
-        """Get configuration value from database with fallback to default"""
+        """Get cached configuration value with fallback to default"""
         try:
-            value = db_manager.get_app_config(config_name)
+            value = self._config.get(config_name)
             if value is not None:
                 # Try to convert to appropriate type
                 if isinstance(default_value, int):
@@ -194,28 +370,33 @@ class MainWindow(QMainWindow):
                 else:
                     return value
             return default_value
-        except Exception as e:
-            print(f"Error loading config {config_name}: {e}")
+        except Exception:
+            logger.exception("Error loading config %s", config_name)
             return default_value
 
+    def _resolve_default_camera(self):
+        """Resolve the configured camera against the detected list once until invalidated"""
+        if self._camera_cache is None:
+            default_camera = self._config.get('default_camera')
+            match = self.camera_manager.find_by_substring(default_camera.lower()) if default_camera else None
+            position, camera = match if match else (-1, None)
+            self._camera_cache = {
+                'name': default_camera,
+                'position': position,
+                'camera': camera,
+            }
+        return self._camera_cache
+
     def validate_camera_from_database(self):
         """Validate if the camera from database is still available"""
         try:
-            default_camera = db_manager.get_app_config('default_camera')
+            resolved = self._resolve_default_camera()
+            default_camera = resolved['name']
             if not default_camera:
                 self.camera_error_label.hide()
                 return
 
-            # Check if the saved camera is still available
-            cameras = self.camera_manager.get_available_cameras()
-            camera_found = False
-
-            for camera in cameras:
-                if default_camera.lower() in camera['name'].lower():
-                    camera_found = True
-                    break
-
-            if not camera_found:
+            if resolved['camera'] is None:
                 # Camera not found, show error
                 self.camera_error_label.setText(f"⚠️ Kamera yang dikonfigurasi '{default_camera}' tidak tersedia. Silakan hubungi admin untuk memperbarui pengaturan kamera.")
                 self.camera_error_label.show()
@@ -224,14 +405,15 @@ class MainWindow(QMainWindow):
                 self.camera_error_label.hide()
 
         except Exception as e:
-            print(f"Error validating camera from database: {e}")
+            logger.exception("Error validating camera from database")
             self.camera_error_label.setText(f"Error validating camera: {str(e)}")
             self.camera_error_label.show()
 
     def auto_select_camera_from_database(self):
         """Auto-select camera from database configuration"""
         try:
-            default_camera = db_manager.get_app_config('default_camera')
+            resolved = self._resolve_default_camera()
+            default_camera = resolved['name']
             if not default_camera:
                 self.camera_status.setText("Kamera: Tidak ada kamera yang dikonfigurasi")
                 self.camera_label.setText("Tidak Ada Kamera Dikonfigurasi\nSilakan hubungi admin untuk mengkonfigurasi kamera")
@@ -239,18 +421,7 @@ class MainWindow(QMainWindow):
                 self.camera_error_label.show()
                 return False
 
-            # Check if the saved camera is still available
-            cameras = self.camera_manager.get_available_cameras()
-            camera_found = False
-            camera_index = -1
-
-            for i, camera in enumerate(cameras):
-                if default_camera.lower() in camera['name'].lower():
-                    camera_found = True
-                    camera_index = i
-                    break
-
-            if not camera_found:
+            if resolved['camera'] is None:
                 # Camera not found, show error
                 self.camera_status.setText(f"Kamera: '{default_camera}' tidak tersedia")
                 self.camera_label.setText(f"Kesalahan Kamera\n'{default_camera}' tidak tersedia\nSilakan hubungi admin untuk memperbarui pengaturan kamera")
@@ -259,13 +430,13 @@ class MainWindow(QMainWindow):
                 return False
             else:
                 # Camera found, select it
-                self.camera_manager.switch_camera(camera_index)
+                self.camera_manager.switch_camera(resolved['position'])
                 self.camera_status.setText(f"Kamera: {default_camera} (Siap)")
                 self.camera_error_label.hide()
                 return True
 
         except Exception as e:
-            print(f"Error auto-selecting camera from database: {e}")
+            logger.exception("Error auto-selecting camera from database")
             self.camera_status.setText("Kamera: Kesalahan memuat konfigurasi")
             self.camera_label.setText("Kesalahan Kamera\nKesalahan memuat konfigurasi kamera\nSilakan hubungi admin")
             self.camera_error_label.setText(f"Kesalahan memuat konfigurasi kamera: {str(e)}")
@@ -275,26 +446,21 @@ class MainWindow(QMainWindow):
     def update_camera_info_display(self):
         """Update camera information display"""
         try:
-            default_camera = db_manager.get_app_config('default_camera')
-            cameras = self.camera_manager.get_available_cameras()
+            resolved = self._resolve_default_camera()
+            default_camera = resolved['name']
 
             if not default_camera:
                 self.camera_info_label.setText("Tidak ada kamera yang dikonfigurasi\nHubungi admin untuk mengatur kamera")
                 return
 
-            # Find the configured camera
-            camera_found = False
-            for camera in cameras:
-                if default_camera.lower() in camera['name'].lower():
-                    self.camera_info_label.setText(f"Kamera yang Dikonfigurasi:\n{camera['name']}\nResolusi: {camera['resolution'][0]}x{camera['resolution'][1]}")
-                    camera_found = True
-                    break
-
-            if not camera_found:
+            camera = resolved['camera']
+            if camera is not None:
+                self.camera_info_label.setText(f"Kamera yang Dikonfigurasi:\n{camera['name']}\nResolusi: {camera['resolution'][0]}x{camera['resolution'][1]}")
+            else:
                 self.camera_info_label.setText(f"Kamera yang Dikonfigurasi:\n{default_camera}\n(Tidak Tersedia)")
 
-        except Exception as e:
-            print(f"Error updating camera info display: {e}")
+        except Exception:
+            logger.exception("Error updating camera info display")
             self.camera_info_label.setText("Kesalahan memuat informasi kamera")
 
     def create_camera_section(self):
@@ -334,58 +500,14 @@ class MainWindow(QMainWindow):
 
         self.camera_container_layout.addWidget(self.camera_label)
 
-        # Countdown overlay (positioned absolutely over camera)
-        self.countdown_label = QLabel()
-        self.countdown_label.setParent(self.camera_container)
-        self.countdown_label.setTextFormat(Qt.TextFormat.RichText)
-        self.countdown_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 150);
-                color: white;
-                font-weight: bold;
-                border-radius: 10px;
-                text-align: center;
-            }
-        """)
-        self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.countdown_label.hide()
-
-        # Capture overlay (positioned absolutely over camera)
-        self.capture_overlay = QLabel()
-        self.capture_overlay.setParent(self.camera_container)
-        self.capture_overlay.setTextFormat(Qt.TextFormat.RichText)
-        self.capture_overlay.setStyleSheet("""
-            QLabel {
-                background-color: rgba(255, 255, 255, 200);
-                color: #2c3e50;
-                font-weight: bold;
-                border-radius: 10px;
-                text-align: center;
-            }
-        """)
-        self.capture_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.capture_overlay.hide()
-
-        # Delay countdown overlay (positioned absolutely over camera)
-        self.delay_overlay = QLabel()
-        self.delay_overlay.setParent(self.camera_container)
-        self.delay_overlay.setTextFormat(Qt.TextFormat.RichText)
-        self.delay_overlay.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 150);
-                color: white;
-                font-weight: bold;
-                border-radius: 10px;
-                text-align: center;
-            }
-        """)
-        self.delay_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.delay_overlay.hide()
-
-        # Position overlays to cover the entire camera container
-        self.countdown_label.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        self.capture_overlay.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        self.delay_overlay.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
+        # Single overlay over the camera; its style switches with the capture state
+        self.overlay_label = QLabel(self.camera_container)
+        self.overlay_label.setTextFormat(Qt.TextFormat.RichText)
+        self.overlay_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.overlay_label.hide()
+        self._overlay_state = None
+        self._overlay_style = None
+        self.camera_container.installEventFilter(self)
 
         # Capture button row
         button_row = QHBoxLayout()
@@ -714,9 +836,7 @@ class MainWindow(QMainWindow):
             self.capture_button.setEnabled(True)
             self.back_to_dashboard_button.setEnabled(True)
             self.progress_bar.hide()
-            self.countdown_label.hide()
-            self.capture_overlay.hide()
-            self.delay_overlay.hide()
+            self._hide_overlay()
 
             # Emit signal so main app can navigate back
             self.back_to_dashboard_requested.emit()
@@ -836,7 +956,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.progress_bar)
 
         # Photo counter
-        self.photo_counter = QLabel("Foto diambil: 0")
+        self.photo_counter = QLabel(self._last_counter_text)
         self.photo_counter.setStyleSheet("QLabel { color: #2c3e50; font-weight: bold; font-size: 18px; }")
         layout.addWidget(self.photo_counter)
 
@@ -869,8 +989,8 @@ class MainWindow(QMainWindow):
             print("Starting camera preview...")
             self.start_camera_preview()
             print("Camera preview started successfully")
-        except Exception as e:
-            print(f"Error starting camera preview: {e}")
+        except Exception:
+            logger.exception("Error starting camera preview")
             self.camera_status.setText("Camera: Error starting preview")
             self.camera_label.setText("Camera Error\nTry refreshing cameras")
 
@@ -879,6 +999,7 @@ class MainWindow(QMainWindow):
         # Force camera re-detection
         self.camera_manager.available_cameras = self.camera_manager.detect_cameras()
         cameras = self.camera_manager.get_available_cameras()
+        self._camera_cache = None
 
         print(f"UI: Refreshing cameras, found {len(cameras)}")
 
@@ -895,30 +1016,30 @@ class MainWindow(QMainWindow):
 
             thread = getattr(self.camera_manager, 'camera_thread', None)
             if thread and thread.isRunning():
-                try:
-                    thread.frame_ready.disconnect(self.update_camera_frame)
-                except TypeError:
-                    pass
-                thread.frame_ready.connect(self.update_camera_frame)
+                self.camera_manager.attach_preview(
+                    self.update_camera_frame, UI_SETTINGS['camera_preview_size']
+                )
                 self.camera_status.setText("Kamera: Aktif")
                 print("Pratinjau kamera sudah berjalan, memakai koneksi yang ada")
             else:
                 print("Mencoba memulai pratinjau kamera...")
-                self.camera_manager.start_preview(self.update_camera_frame)
+                self.camera_manager.start_preview(
+                    self.update_camera_frame, UI_SETTINGS['camera_preview_size']
+                )
                 self.camera_status.setText("Kamera: Memulai...")
                 print("Perintah memulai pratinjau kamera telah dikirim")
 
             # Set a timer to check if preview actually started
             QTimer.singleShot(3000, self.check_camera_status)
 
-        except Exception as e:
-            print(f"Error in start_camera_preview: {e}")
+        except Exception:
+            logger.exception("Error in start_camera_preview")
             self.camera_status.setText("Kamera: Kesalahan")
             self.camera_label.setText("Kesalahan Kamera\nKesalahan memulai pratinjau kamera\nSilakan hubungi admin")
 
     def check_camera_status(self):
         """Check if camera preview is actually working"""
-        if hasattr(self.camera_manager, 'camera_thread') and self.camera_manager.camera_thread:
+        if self.camera_manager.camera_thread is not None:
             if self.camera_manager.camera_thread.isRunning():
                 self.camera_status.setText("Kamera: Aktif")
                 print("Camera preview confirmed active")
@@ -929,15 +1050,13 @@ class MainWindow(QMainWindow):
             self.camera_status.setText("Kamera: Belum diinisialisasi")
             print("Camera thread not created")
 
-    def update_camera_frame(self, frame):
+    def update_camera_frame(self, image):
         """Update camera preview frame"""
         # Always update the camera preview, even during countdown
-        # Convert frame to QPixmap and display with proper aspect ratio
-        pixmap = self.camera_manager.frame_to_qpixmap(
-            frame, UI_SETTINGS['camera_preview_size'], maintain_aspect_ratio=True
+        # The camera thread already scaled and converted the frame for display
+        self.camera_label.setPixmap(
+            QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
         )
-        self.camera_label.setPixmap(pixmap)
-        self.camera_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def start_photo_capture(self):
         """Start photo capture sequence"""
@@ -968,7 +1087,7 @@ class MainWindow(QMainWindow):
         photo_count = self.get_config_value('photo_count', CAMERA_SETTINGS['capture_count'])
 
         self._play_tick_sound()
-        self.countdown_label.setText((
+        self._set_overlay('countdown', (
             f"""
             <div style="text-align:center;">
                 <div style="font-size:120px;font-weight:700;">{count}</div>
@@ -976,20 +1095,16 @@ class MainWindow(QMainWindow):
             </div>
             """
         ).strip())
-        # Position countdown to cover the entire camera container
-        self.countdown_label.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        self.countdown_label.show()
-        self.countdown_label.raise_()
 
     def capture_photos(self):
         """Start capturing multiple photos asynchronously"""
         # Hide countdown
-        self.countdown_label.hide()
+        self._hide_overlay('countdown')
 
         count = self.photo_count_spin.value()
         delay = self.delay_spin.value()
 
-        print(f"Starting capture sequence: {count} photos with {delay}s delay")
+        logger.info("Starting capture sequence: %d photos with %ds delay", count, delay)
 
         # Start async photo capture
         self.photo_capture_thread = PhotoCaptureThread(
@@ -997,36 +1112,71 @@ class MainWindow(QMainWindow):
         )
         self.photo_capture_thread.capture_starting.connect(self.on_capture_starting)
         self.photo_capture_thread.photo_captured.connect(self.on_photo_captured)
-        self.photo_capture_thread.delay_countdown.connect(self.on_delay_countdown)
+        self.photo_capture_thread.delay_started.connect(self.on_delay_started)
         self.photo_capture_thread.capture_complete.connect(self.on_capture_complete)
         self.photo_capture_thread.start()
 
     def on_capture_starting(self, current, total):
         """Handle when a photo is about to be captured"""
-        # Hide delay overlay if it's showing
-        self.delay_overlay.hide()
+        self._delay_timer.stop()
 
         # Play shutter sound effect
         self._play_shutter_sound()
 
-        # Show capture overlay
-        self.capture_overlay.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        self.capture_overlay.show()
-        self.capture_overlay.raise_()
-        print(f"About to capture photo {current}/{total}")
+        # Show capture overlay (replaces the delay overlay if it's showing)
+        self._set_overlay('capture')
+        logger.debug("About to capture photo %d/%d", current, total)
 
         # Hide capture overlay after 1 second
         QTimer.singleShot(1000, self.hide_capture_overlay)
 
     def hide_capture_overlay(self):
         """Hide the capture overlay"""
-        self.capture_overlay.hide()
+        # The delay countdown may already have taken over the overlay
+        self._hide_overlay('capture')
+
+    def _set_overlay(self, state, text=""):
+        """Show the camera overlay in the given state"""
+        if self._overlay_style != state:
+            self.overlay_label.setStyleSheet(self._OVERLAY_STYLES[state])
+            self._overlay_style = state
+        self._overlay_state = state
+        self.overlay_label.setText(text)
+        if not self.overlay_label.isVisible():
+            # Hidden overlays skip container resizes, so catch up before showing
+            self.overlay_label.setGeometry(self.camera_container.rect())
+        self.overlay_label.show()
+        self.overlay_label.raise_()
+
+    def _hide_overlay(self, state=None):
+        """Hide the camera overlay, optionally only while it is in the given state"""
+        if state is not None and self._overlay_state != state:
+            return
+        self._overlay_state = None
+        self.overlay_label.hide()
+
+    def on_delay_started(self, current, total, delay):
+        """Start the GUI-side countdown for the delay before the next photo"""
+        self._delay_deadline = time.monotonic() + delay
+        self._delay_photo = (current, total)
+        self._delay_remaining = None
+        self._update_delay_countdown()
+        self._delay_timer.start()
+
+    def _update_delay_countdown(self):
+        """Refresh the delay overlay whenever the remaining whole seconds change"""
+        remaining = math.ceil(self._delay_deadline - time.monotonic())
+        if remaining <= 0:
+            self._delay_timer.stop()
+            return
+        if remaining == self._delay_remaining:
+            return
+        self._delay_remaining = remaining
+        current, total = self._delay_photo
 
-    def on_delay_countdown(self, current, total, remaining):
-        """Handle delay countdown between photos"""
         # Show delay overlay
         self._play_tick_sound()
-        self.delay_overlay.setText((
+        self._set_overlay('delay', (
             f"""
             <div style="text-align:center;">
                 <div style="font-size:110px;font-weight:700;">{remaining}</div>
@@ -1034,33 +1184,49 @@ class MainWindow(QMainWindow):
             </div>
             """
         ).strip())
-        self.delay_overlay.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        self.delay_overlay.show()
-        self.delay_overlay.raise_()
-        print(f"Delay countdown: {remaining} seconds until photo {current + 1}")
+        logger.debug("Delay countdown: %d seconds until photo %d", remaining, current + 1)
 
     def on_photo_captured(self, current, total, photo_path):
         """Handle individual photo captured"""
+        self._pending_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+        logger.debug("Photo %d/%d captured: %s", current, total, photo_path or 'Failed')
+
+    def _flush_progress(self):
+        """Apply the latest pending progress to the progress bar and counter"""
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(current)
-        self.photo_counter.setText(f"Foto diambil: {current}/{total}")
-        print(f"Photo {current}/{total} captured: {os.path.basename(photo_path) if photo_path else 'Failed'}")
+        self._set_counter_text(self._counter_fmt(current, total))
+
+    def _set_counter_text(self, text):
+        """Update the photo counter only when its text actually changes"""
+        if text != self._last_counter_text:
+            self.photo_counter.setText(text)
+            self._last_counter_text = text
 
     def on_capture_complete(self, captured_paths):
         """Handle capture sequence completion"""
-        print(f"Capture sequence complete: {len(captured_paths)} photos captured")
+        logger.info("Capture sequence complete: %d photos captured", len(captured_paths))
 
-        # Hide all overlays
-        self.delay_overlay.hide()
-        self.capture_overlay.hide()
-
-        # Re-enable capture button
-        self.capture_button.setEnabled(True)
-        self.back_to_dashboard_button.setEnabled(True)
+        self._delay_timer.stop()
+        self._progress_timer.stop()
+        self._pending_progress = None
         self.countdown_active = False
-        self.progress_bar.hide()
 
-        # Update final counter
-        self.photo_counter.setText(f"Foto diambil: {len(captured_paths)}")
+        # Switch back to the idle state in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._hide_overlay()
+            self.capture_button.setEnabled(True)
+            self.back_to_dashboard_button.setEnabled(True)
+            self.progress_bar.hide()
+            self._set_counter_text(f"Foto diambil: {len(captured_paths)}")
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Emit signal with captured photos
         if captured_paths:
@@ -1068,102 +1234,39 @@ class MainWindow(QMainWindow):
 
     def apply_modern_style(self):
         """Apply modern styling to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ecf0f1;
-            }
-            QFrame {
-                background-color: white;
-                border-radius: 10px;
-                margin: 5px;
-                padding: 10px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                font-size: 12px;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #f8f9fa;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #34495e;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #2c3e50;
-            }
-            QPushButton:pressed {
-                background-color: #1b2631;
-            }
-            QComboBox {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: white;
-            }
-            QSpinBox {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                padding: 5px;
-                background-color: white;
-            }
-            QProgressBar {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 3px;
-            }
-            QLabel {
-                color: #2c3e50;
-                background-color: transparent;
-            }
-            QComboBox {
-                color: #2c3e50;
-            }
-            QSpinBox {
-                color: #2c3e50;
-            }
-        """)
-
-    def resizeEvent(self, event):
-        """Handle window resize event"""
-        super().resizeEvent(event)
-        # Update overlay positions if they're visible
-        if hasattr(self, 'countdown_label') and self.countdown_label.isVisible():
-            self.countdown_label.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        if hasattr(self, 'capture_overlay') and self.capture_overlay.isVisible():
-            self.capture_overlay.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
-        if hasattr(self, 'delay_overlay') and self.delay_overlay.isVisible():
-            self.delay_overlay.setGeometry(0, 0, self.camera_container.width(), self.camera_container.height())
+        self.setStyleSheet(_MODERN_STYLE)
+
+    def eventFilter(self, watched, event):
+        """Keep the overlay covering the camera container whenever the container resizes"""
+        if (
+            watched is self.camera_container
+            and event.type() == QEvent.Type.Resize
+            and self.overlay_label.isVisible()
+        ):
+            # The overlay sits at the container origin, so the event's new size is all it needs
+            self.overlay_label.resize(event.size())
+        return super().eventFilter(watched, event)
 
     def stop_camera(self):
         """Stop camera preview and cleanup resources"""
-        print("Stopping camera preview...")
+        logger.info("Stopping camera preview...")
+
+        self._delay_timer.stop()
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._hide_overlay()
+
+        # Stop the pre-capture countdown if it's still ticking
+        if self.capture_timer and self.capture_timer.isRunning():
+            self.capture_timer.requestInterruption()
+            self.capture_timer.wait(1000)
 
         # Stop photo capture thread if running
         if self.photo_capture_thread and self.photo_capture_thread.isRunning():
-            print("Stopping photo capture thread...")
-            self.photo_capture_thread.requestInterruption()
-            self.photo_capture_thread.quit()
-            self.photo_capture_thread.wait(3000)  # Wait up to 3 seconds
-            if self.photo_capture_thread.isRunning():
-                print("Force terminating photo capture thread...")
+            logger.info("Stopping photo capture thread...")
+            # Delays wake on cancel, so only a capture in progress can hold this up
+            if not self.photo_capture_thread.cancel(3000):
+                logger.warning("Force terminating photo capture thread...")
                 self.photo_capture_thread.terminate()
                 self.photo_capture_thread.wait(1000)
             self.photo_capture_thread = None
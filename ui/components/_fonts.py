@@ -0,0 +1,42 @@
+"""
+Shared fonts for UI components
+"""
+from functools import lru_cache
+from PyQt6.QtGui import QFont
+
+
+# Fonts are built on first use so nothing touches the font database before QApplication exists
+@lru_cache(maxsize=None)
+def heading_xlarge():
+    """Bold 32pt font for the login title"""
+    return QFont("Helvetica", 32, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=None)
+def heading_large():
+    """Bold 28pt font for page titles"""
+    return QFont("Helvetica", 28, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=None)
+def heading_small():
+    """Bold 14pt font for status text"""
+    return QFont("Helvetica", 14, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=None)
+def subheading():
+    """Regular 18pt font for subtitles"""
+    return QFont("Helvetica", 18)
+
+
+@lru_cache(maxsize=None)
+def body_large():
+    """Regular 22pt base font for the touch-sized login and role screens"""
+    return QFont("Helvetica", 22)
+
+
+@lru_cache(maxsize=None)
+def body():
+    """Regular 14pt font for body text"""
+    return QFont("Helvetica", 14)
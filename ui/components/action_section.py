@@ -4,61 +4,129 @@ Action section component for dashboard
 from PyQt6.QtWidgets import (
     QGroupBox,
     QVBoxLayout,
-    QLabel,
+    QFrame,
+    QGraphicsItem,
+    QGraphicsScene,
+    QGraphicsView,
     QSizePolicy,
-    QScrollArea,
-    QWidget,
 )
-from PyQt6.QtGui import QFont, QPixmap
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache, QTransform
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 import os
 from config import ASSETS_DIR
+from ui.components._fonts import body
 
 
 INSTRUCTIONS_IMAGE_PATH = os.path.join(ASSETS_DIR, "petunjuk.jpg")
+_INSTRUCTIONS_CACHE_KEY = "petunjuk"
 
 
-class AspectRatioPixmapLabel(QLabel):
+_INSTRUCTIONS_MISSING_TEXT = (
+    "Gambar petunjuk tidak tersedia.\n"
+    "Pastikan berkas assets/petunjuk.jpg ada."
+)
+
+
+class InstructionsImageSignals(QObject):
+    """Signals for InstructionsImageLoader, which can't carry its own as a QRunnable"""
+    loaded = pyqtSignal(QImage)
+
+
+class InstructionsImageLoader(QRunnable):
+    """Decode the instructions image on a pool thread"""
+
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        # QImage is safe to decode off the GUI thread; QPixmap is not
+        self.signals.loaded.emit(QImage(INSTRUCTIONS_IMAGE_PATH))
+
+
+class AspectRatioPixmapView(QGraphicsView):
+    """Shows a pixmap scaled to the view width, scrolling vertically when it is taller"""
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._pixmap = None
+        self._scene = QGraphicsScene(self)
+        self._item = None
+        self._text_item = None
+        self._fast_mode = False
+        # Resizes scale with fast transforms; the smooth one runs once resizing settles
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(120)
+        self._settle_timer.timeout.connect(self._settle)
+        self.setScene(self._scene)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setBackgroundBrush(QColor("#FFFFFF"))
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
     def setPixmap(self, pixmap):
-        self._pixmap = pixmap
-        # Selalu set pixmap asli dulu supaya tidak kosong
-        super().setPixmap(pixmap)
-        if self._pixmap is not None and not self._pixmap.isNull():
-            self._update_scaled_pixmap()
+        self._scene.clear()
+        self._text_item = None
+        self._item = self._scene.addPixmap(pixmap)
+        self._item.setTransformationMode(self._transformation_mode())
+        # The scaled rendering is kept until the view transform changes again
+        self._item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self._scene.setSceneRect(self._item.boundingRect())
+        self._fit_to_width()
+
+    def setText(self, text):
+        self._scene.clear()
+        self._item = None
+        self._text_item = self._scene.addText(text, body())
+        self._text_item.setDefaultTextColor(QColor("#2c3e50"))
+        self.resetTransform()
+        self._wrap_text()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if self._pixmap is not None and not self._pixmap.isNull():
-            self._update_scaled_pixmap()
-
-    def _update_scaled_pixmap(self):
-        if (
-            self._pixmap is None
-            or self._pixmap.isNull()
-        ):
+        if self._item is not None:
+            self._set_fast_mode(True)
+            self._settle_timer.start()
+        self._fit_to_width()
+        self._wrap_text()
+
+    def _transformation_mode(self):
+        if self._fast_mode:
+            return Qt.TransformationMode.FastTransformation
+        return Qt.TransformationMode.SmoothTransformation
+
+    def _set_fast_mode(self, fast):
+        """Switch between fast and smooth pixmap scaling"""
+        if self._fast_mode == fast:
             return
-        parent = self.parent()
-        available_width = parent.width() if parent is not None else self.width()
-        if available_width <= 0:
+        self._fast_mode = fast
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not fast)
+        if self._item is not None:
+            self._item.setTransformationMode(self._transformation_mode())
+
+    def _settle(self):
+        self._set_fast_mode(False)
+
+    def _wrap_text(self):
+        """Wrap placeholder text to the current viewport width"""
+        if self._text_item is None:
             return
-        original_width = self._pixmap.width()
-        original_height = self._pixmap.height()
-        if original_width <= 0 or original_height <= 0:
+        self._text_item.setTextWidth(max(self.viewport().width() - 20, 100))
+        self._scene.setSceneRect(self._text_item.boundingRect())
+
+    def _fit_to_width(self):
+        """Scale the view so the pixmap spans the viewport width; only the matrix changes"""
+        if self._item is None:
             return
-        target_width = available_width
-        target_height = int(target_width * original_height / original_width)
-        scaled = self._pixmap.scaled(
-            target_width,
-            target_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        super().setPixmap(scaled)
-        self.setMinimumSize(scaled.size())
+        pixmap_width = self._item.pixmap().width()
+        available_width = self.viewport().width()
+        if pixmap_width <= 0 or available_width <= 0:
+            return
+        scale = available_width / pixmap_width
+        self.setTransform(QTransform.fromScale(scale, scale))
 
 
 class ActionSection:
@@ -66,59 +134,46 @@ class ActionSection:
 
     def __init__(self):
         self.instructions_label = None
+        self._loader_signals = None
 
     def create(self, parent):
         """Create action buttons section"""
         group = QGroupBox()
-        group.setFont(QFont("Helvetica", 14, QFont.Weight.Bold))
         layout = QVBoxLayout(group)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(10)
 
-        self.instructions_label = AspectRatioPixmapLabel()
-        self.instructions_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # The view scrolls on its own, so it no longer needs a QScrollArea around it
+        self.instructions_label = AspectRatioPixmapView()
         self.instructions_label.setSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
         )
         # Minimal ukuran agar selalu terlihat (rasio 16:9)
         self.instructions_label.setMinimumSize(640, 360)
-        self.instructions_label.setStyleSheet("""
-            QLabel {
-                background-color: #FFFFFF;
-                border-radius: 12px;
-                padding: 10px;
-            }
-        """)
-
-        pixmap = QPixmap(INSTRUCTIONS_IMAGE_PATH)
-        if not pixmap.isNull():
+        self.instructions_label.setObjectName("InstructionsView")
+
+        pixmap = QPixmapCache.find(_INSTRUCTIONS_CACHE_KEY)
+        if pixmap is not None:
             self.instructions_label.setPixmap(pixmap)
         else:
-            self.instructions_label.setText(
-                "Gambar petunjuk tidak tersedia.\n"
-                "Pastikan berkas assets/petunjuk.jpg ada."
-            )
-            self.instructions_label.setWordWrap(True)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setContentsMargins(0, 0, 0, 0)
-        scroll_layout.setSpacing(0)
-        scroll_layout.addWidget(self.instructions_label, 0, Qt.AlignmentFlag.AlignTop)
-
-        scroll_area.setWidget(scroll_content)
-        layout.addWidget(scroll_area)
+            # Decode in the background so the dashboard paints right away
+            self.instructions_label.setText("Memuat petunjuk...")
+            self._loader_signals = InstructionsImageSignals()
+            self._loader_signals.loaded.connect(self._on_instructions_loaded)
+            QThreadPool.globalInstance().start(InstructionsImageLoader(self._loader_signals))
+
+        layout.addWidget(self.instructions_label)
 
         return group
+
+    def _on_instructions_loaded(self, image):
+        """Swap the decoded instructions image into the view"""
+        if self.instructions_label is None:
+            return
+        if image.isNull():
+            self.instructions_label.setText(_INSTRUCTIONS_MISSING_TEXT)
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(_INSTRUCTIONS_CACHE_KEY, pixmap)
+        self.instructions_label.setPixmap(pixmap)
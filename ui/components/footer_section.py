@@ -2,6 +2,30 @@
 Footer section component for dashboard
 """
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import Qt
+from ui.components._fonts import heading_small
+
+
+_STATUS_LABEL_COLOR = QColor("#27ae60")
+
+_LOGOUT_BUTTON_QSS = """
+    QPushButton {
+        background-color: #e74c3c;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #c0392b;
+    }
+    QPushButton:pressed {
+        background-color: #a93226;
+    }
+"""
 
 
 class FooterSection:
@@ -21,36 +45,19 @@ class FooterSection:
 
         # Left side - Status info
         status_label = QLabel("Sistem siap digunakan")
-        status_label.setStyleSheet("""
-            QLabel {
-                color: #27ae60;
-                font-size: 14px;
-                font-weight: bold;
-            }
-        """)
+        status_label.setTextFormat(Qt.TextFormat.PlainText)
+        # Color and font only, so the palette covers it without the stylesheet engine
+        palette = status_label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, _STATUS_LABEL_COLOR)
+        status_label.setPalette(palette)
+        status_label.setFont(heading_small())
         layout.addWidget(status_label)
 
         # Right side - Logout button
         layout.addStretch()
         self.logout_btn = QPushButton("🚪 Logout")
         self.logout_btn.setMinimumHeight(40)
-        self.logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        self.logout_btn.setStyleSheet(_LOGOUT_BUTTON_QSS)
         layout.addWidget(self.logout_btn)
 
         return footer_frame
@@ -18,6 +18,80 @@ class NavigationHeader(QFrame):
     prev_clicked = pyqtSignal()
     next_clicked = pyqtSignal()
 
+    # Stylesheets are shared by every header instance instead of rebuilt per page
+    _STEP_QSS = """
+        QLabel {
+            color: #7f8c8d;
+            font-size: 14px;
+            font-weight: bold;
+            margin: 0;
+            padding: 0;
+        }
+    """
+
+    _TITLE_QSS = """
+        QLabel {
+            color: #2c3e50;
+            font-size: 24px;
+            font-weight: bold;
+            margin: 0;
+            padding: 0;
+        }
+    """
+
+    _SUBTITLE_QSS = """
+        QLabel {
+            color: #4a4a4a;
+            font-size: 14px;
+            margin: 0;
+            padding: 0;
+        }
+    """
+
+    _PREV_BTN_QSS = """
+        QPushButton {
+            background-color: #2c3e50;
+            color: #ffffff;
+            border: none;
+            border-radius: 24px;
+            padding: 0 28px;
+            font-size: 14px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #1f2a36;
+        }
+        QPushButton:disabled {
+            background-color: #95a5a6;
+        }
+    """
+
+    _NEXT_BTN_QSS = """
+        QPushButton {
+            background-color: #E60012;
+            color: #ffffff;
+            border: none;
+            border-radius: 24px;
+            padding: 0 32px;
+            font-size: 14px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #c2000f;
+        }
+        QPushButton:disabled {
+            background-color: #f5b7b1;
+            color: #ffffff;
+        }
+    """
+
+    _FRAME_QSS = """
+        #NavigationHeader {
+            background-color: #ffffff;
+            border-bottom: 1px solid #e0e0e0;
+        }
+    """
+
     def __init__(
         self,
         step: int,
@@ -49,42 +123,23 @@ class NavigationHeader(QFrame):
         text_container.setContentsMargins(0, 0, 0, 0)
         text_container.setSpacing(0)
 
+        # Header texts are plain, so setText skips the rich text check
         self.step_label = QLabel()
+        self.step_label.setTextFormat(Qt.TextFormat.PlainText)
         self.step_label.setContentsMargins(0, 0, 0, 0)
-        self.step_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                font-size: 14px;
-                font-weight: bold;
-                margin: 0;
-                padding: 0;
-            }
-        """)
+        self.step_label.setStyleSheet(self._STEP_QSS)
         text_container.addWidget(self.step_label)
 
         self.title_label = QLabel()
+        self.title_label.setTextFormat(Qt.TextFormat.PlainText)
         self.title_label.setContentsMargins(0, 0, 0, 0)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #2c3e50;
-                font-size: 24px;
-                font-weight: bold;
-                margin: 0;
-                padding: 0;
-            }
-        """)
+        self.title_label.setStyleSheet(self._TITLE_QSS)
         text_container.addWidget(self.title_label)
 
         self.subtitle_label = QLabel()
+        self.subtitle_label.setTextFormat(Qt.TextFormat.PlainText)
         self.subtitle_label.setContentsMargins(0, 0, 0, 0)
-        self.subtitle_label.setStyleSheet("""
-            QLabel {
-                color: #4a4a4a;
-                font-size: 14px;
-                margin: 0;
-                padding: 0;
-            }
-        """)
+        self.subtitle_label.setStyleSheet(self._SUBTITLE_QSS)
         text_container.addWidget(self.subtitle_label)
 
         layout.addLayout(text_container)
@@ -98,23 +153,7 @@ class NavigationHeader(QFrame):
                 self.prev_button = QPushButton(prev_text)
                 self.prev_button.setMinimumHeight(48)
                 self.prev_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-                self.prev_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2c3e50;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 24px;
-                        padding: 0 28px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #1f2a36;
-                    }
-                    QPushButton:disabled {
-                        background-color: #95a5a6;
-                    }
-                """)
+                self.prev_button.setStyleSheet(self._PREV_BTN_QSS)
                 self.prev_button.clicked.connect(self.prev_clicked.emit)
                 button_row.addWidget(self.prev_button, 0, Qt.AlignmentFlag.AlignLeft)
             else:
@@ -126,35 +165,13 @@ class NavigationHeader(QFrame):
                 self.next_button = QPushButton(next_text)
                 self.next_button.setMinimumHeight(48)
                 self.next_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-                self.next_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #E60012;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 24px;
-                        padding: 0 32px;
-                        font-size: 14px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #c2000f;
-                    }
-                    QPushButton:disabled {
-                        background-color: #f5b7b1;
-                        color: #ffffff;
-                    }
-                """)
+                self.next_button.setStyleSheet(self._NEXT_BTN_QSS)
                 self.next_button.clicked.connect(self.next_clicked.emit)
                 button_row.addWidget(self.next_button, 0, Qt.AlignmentFlag.AlignRight)
 
             layout.addLayout(button_row)
 
-        self.setStyleSheet("""
-            #NavigationHeader {
-                background-color: #ffffff;
-                border-bottom: 1px solid #e0e0e0;
-            }
-        """)
+        self.setStyleSheet(self._FRAME_QSS)
 
     def set_step(self, step: int, total_steps: int):
         self.step_label.setText(f"Langkah {step} dari {total_steps}")
@@ -1,8 +1,14 @@
 """
 User information section component for dashboard
 """
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QLabel
-from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QGroupBox, QFormLayout, QLabel
+from PyQt6.QtCore import Qt
+
+
+_P_NAME = "👤 "
+_P_NPK = "NPK: "
+_P_ROLE = "Role: "
+_P_DEPT = "Dept: "
 
 
 class UserInfoSection:
@@ -17,10 +23,11 @@ class UserInfoSection:
     def create(self, parent):
         """Create user information section"""
         group = QGroupBox()
-        group.setFont(QFont("Helvetica", 18, QFont.Weight.Bold))
-        layout = QVBoxLayout(group)
+        # Rows pack to the top of the form, so no trailing stretch item is needed
+        layout = QFormLayout(group)
         layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(15)
+        layout.setVerticalSpacing(15)
+        layout.setFormAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
 
         # User info labels
         self.user_name_label = QLabel("Memuat...")
@@ -28,49 +35,45 @@ class UserInfoSection:
         self.user_role_label = QLabel("")
         self.user_department_label = QLabel("")
 
-        # Style the labels
-        user_style = """
-            QLabel {
-                font-size: 24px;
-                color: #2c3e50;
-                margin: 5px 0px;
-                padding: 5px;
-                border-radius: 5px;
-            }
-        """
-
-        self.user_name_label.setStyleSheet(user_style + """
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #E60012;
-                background-color: #fff5f5;
-            }
-        """)
+        # Label styling lives in the dashboard window sheet, keyed by these object names
+        self.user_name_label.setObjectName("UserNameLabel")
+        self.user_npk_label.setObjectName("UserInfoLabel")
+        self.user_role_label.setObjectName("UserInfoLabel")
+        self.user_department_label.setObjectName("UserInfoLabel")
 
-        self.user_npk_label.setStyleSheet(user_style)
-        self.user_role_label.setStyleSheet(user_style)
-        self.user_department_label.setStyleSheet(user_style)
-
-        layout.addWidget(self.user_name_label)
-        layout.addWidget(self.user_npk_label)
-        layout.addWidget(self.user_role_label)
-        layout.addWidget(self.user_department_label)
-
-        # Add some spacing
-        layout.addStretch()
+        for label in (
+            self.user_name_label,
+            self.user_npk_label,
+            self.user_role_label,
+            self.user_department_label,
+        ):
+            # User data is never markup, so setText skips the rich text check
+            label.setTextFormat(Qt.TextFormat.PlainText)
+            layout.addRow(label)
 
         return group
 
     def update_user_info(self, current_user):
         """Update user information display"""
         if current_user:
-            self.user_name_label.setText(f"👤 {current_user.get('name', 'Unknown')}")
-            self.user_npk_label.setText(f"NPK: {current_user.get('npk', 'N/A')}")
-            self.user_role_label.setText(f"Role: {current_user.get('role', 'N/A').title()}")
-            self.user_department_label.setText(f"Dept: {current_user.get('department_name', 'N/A')}")
+            get = current_user.get
+            # department_name is nullable, so it keeps the str() the f-string did
+            texts = (
+                _P_NAME + get('name', 'Unknown'),
+                _P_NPK + get('npk', 'N/A'),
+                _P_ROLE + get('role', 'N/A').title(),
+                _P_DEPT + str(get('department_name', 'N/A')),
+            )
         else:
-            self.user_name_label.setText("Tidak ada data pengguna")
-            self.user_npk_label.setText("")
-            self.user_role_label.setText("")
-            self.user_department_label.setText("")
+            texts = ("Tidak ada data pengguna", "", "", "")
+
+        labels = (
+            self.user_name_label,
+            self.user_npk_label,
+            self.user_role_label,
+            self.user_department_label,
+        )
+        for label, text in zip(labels, texts):
+            # Unchanged labels are skipped so refreshes don't trigger needless repaints
+            if label.text() != text:
+                label.setText(text)
@@ -4,22 +4,144 @@ Welcome page for logged-in users with options to start photo capture
 """
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QDialog, QLabel, QPushButton, QSizePolicy, QFrame)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from datetime import datetime, timedelta
+from functools import cached_property
+import logging
+import time
 
 # Import components
 from ui.components.user_info_section import UserInfoSection
 from ui.components.action_section import ActionSection
-
-# Import dialogs
-from ui.dialogs.custom_dialog import CustomStyledDialog
-from ui.dialogs.request_dialog import RequestDialog
+from ui.components._fonts import heading_large
 
 # Import utilities
 from utils.datetime_utils import parse_datetime
 from modules.session_manager import session_manager
 from modules.database import db_manager
+from utils.ui_utils import load_stylesheet, minify_stylesheet
+
+logger = logging.getLogger(__name__)
+
+# Header button rules live in the window sheet so their ID selectors win over its QPushButton rule
+_HEADER_BUTTONS_QSS = load_stylesheet("dashboard.qss")
+
+# Dialog texts shown from the start button flow and logout
+_NO_USER_TITLE = "Pengguna Tidak Ditemukan"
+_NO_USER_MESSAGE = "Tidak ada pengguna yang sedang login. Silakan login kembali."
+_REQUEST_SENT_TITLE = "Permintaan Terkirim"
+_REQUEST_SENT_MESSAGE = "Permintaan Anda telah dikirim ke admin untuk ditinjau."
+_REQUEST_LOAD_FAILED_TITLE = "Gagal Memuat Permintaan"
+_REQUEST_LOAD_FAILED_MESSAGE = "Data permintaan tidak dapat dimuat. Silakan coba lagi."
+_LOGOUT_TITLE = "Konfirmasi Keluar"
+_LOGOUT_MESSAGE = "Apakah Anda yakin ingin logout?"
+
+# Seconds a looked-up latest request is reused before asking the database again
+_LATEST_REQUEST_TTL = 30
+
+_MAIN_QSS_RAW = """
+    QMainWindow {
+        background-color: #f5f6fa;
+    }
+    QFrame {
+        background-color: white;
+        border-radius: 10px;
+        margin: 5px;
+        padding: 10px;
+    }
+    QGroupBox {
+        font-family: Helvetica;
+        font-weight: bold;
+        font-size: 14px;
+        color: #2c3e50;
+        border: 2px solid #bdc3c7;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 15px;
+        background-color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 10px 0 10px;
+        background-color: #f5f6fa;
+    }
+    QPushButton {
+        background-color: #34495e;
+        color: white;
+        font-weight: bold;
+        border: none;
+        padding: 10px;
+        min-height: 20px;
+    }
+    QPushButton:hover {
+        background-color: #2c3e50;
+    }
+    QPushButton:pressed {
+        background-color: #1b2631;
+    }
+    QLabel {
+        color: #2c3e50;
+        background-color: transparent;
+    }
+    #ContentFrame QWidget {
+        background-color: white;
+        border-radius: 10px;
+        margin: 5px;
+        padding: 10px;
+    }
+    #ContentFrame #UserNameLabel, #ContentFrame #UserInfoLabel {
+        font-size: 24px;
+        color: #2c3e50;
+        margin: 5px 0px;
+        padding: 5px;
+        border-radius: 5px;
+    }
+    #ContentFrame #UserNameLabel {
+        font-weight: bold;
+        color: #E60012;
+        background-color: #fff5f5;
+    }
+    #ContentFrame #InstructionsView {
+        background-color: #FFFFFF;
+        border: none;
+        border-radius: 12px;
+        padding: 10px;
+    }
+    #WelcomeTitleLabel {
+        color: #E60012;
+        margin-bottom: 6px;
+    }
+""" + _HEADER_BUTTONS_QSS
+
+_MAIN_QSS = minify_stylesheet(_MAIN_QSS_RAW)
+
+
+class LatestRequestSignals(QObject):
+    """Signals for LatestRequestFetcher, which can't carry its own as a QRunnable"""
+    # Both carry the fetch's token so the dashboard can drop results it no longer waits for
+    loaded = pyqtSignal(int, object)
+    failed = pyqtSignal(int)
+
+
+class LatestRequestFetcher(QRunnable):
+    """Look up a user's latest request on a pool thread"""
+
+    def __init__(self, npk, token, signals):
+        super().__init__()
+        self.npk = npk
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        try:
+            latest_request = db_manager.get_latest_request(self.npk)
+        except Exception:
+            logger.exception("Failed to load latest request")
+            self.signals.failed.emit(self.token)
+            return
+        self.signals.loaded.emit(self.token, latest_request)
 
 
 class DashboardWindow(QMainWindow):
@@ -28,63 +150,78 @@ class DashboardWindow(QMainWindow):
     start_photo_capture = pyqtSignal()  # Signal emitted when user wants to start photo capture
     logout_requested = pyqtSignal()  # Signal emitted when logout is requested
 
-    def __init__(self):
+    def __init__(self, auto_show=True):
         super().__init__()
+        self._auto_show = auto_show
         self.current_user = None
-        self.top_logout_btn = None
-        self.top_start_btn = None
+        self._latest_request_cache = {}
+        self._content_built = False
+        self._pending_request = None
+        self._request_token = 0
+        self._latest_request_signals = LatestRequestSignals(self)
+        self._latest_request_signals.loaded.connect(self._on_latest_request_loaded)
+        self._latest_request_signals.failed.connect(self._on_latest_request_failed)
 
         # Initialize components
         self.user_info_section = UserInfoSection()
         self.action_section = ActionSection()
 
+        # init_ui shows the window fullscreen unless the caller shows it itself (auto_show=False)
         self.init_ui()
 
-        # Force window to be visible
-        self.show()
-        self.raise_()
-        self.activateWindow()
-
     def init_ui(self):
         """Initialize user interface"""
         self.setWindowTitle("ID Card Photo Machine - Dashboard")
-        # Set to fullscreen by default
-        self.showFullScreen()
+        # Set to fullscreen by default; callers that show the window only need the state
+        if self._auto_show:
+            self.showFullScreen()
+        else:
+            self.setWindowState(Qt.WindowState.WindowFullScreen)
 
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
         # Main layout
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(20)
+        self._main_layout = QVBoxLayout(central_widget)
+        self._main_layout.setContentsMargins(20, 20, 20, 20)
+        self._main_layout.setSpacing(20)
 
         # Header section
         header_section = self.create_header_section()
-        main_layout.addWidget(header_section)
+        self._main_layout.addWidget(header_section)
 
-        # Main content section
-        content_section = self.create_content_section()
-        main_layout.addWidget(content_section)
-
-        # Connect signals
-        self.connect_signals()
+        # The content section is built right after the first paint
+        QTimer.singleShot(0, self._build_deferred_sections)
 
         # Set style
         self.apply_modern_style()
 
+    def _build_deferred_sections(self):
+        """Build the main content section and fill it with the current user"""
+        if self._content_built:
+            return
+        # By now the window is usually on screen, so hold its repaints while the section is added
+        central_widget = self.centralWidget()
+        freeze = central_widget.isVisible()
+        if freeze:
+            central_widget.setUpdatesEnabled(False)
+        content_section = self.create_content_section()
+        self._main_layout.addWidget(content_section)
+        self._content_built = True
+        if freeze:
+            central_widget.setUpdatesEnabled(True)
+        self.update_user_info()
+
     def create_content_section(self):
         """Create main content section with user info and actions"""
         content_frame = QWidget()
-        content_frame.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 10px;
-                margin: 5px;
-                padding: 10px;
-            }
-        """)
+        content_frame.setObjectName("ContentFrame")
+        # The frame's own white fill comes from its palette; only its children are styled
+        palette = content_frame.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor("white"))
+        content_frame.setPalette(palette)
+        content_frame.setAutoFillBackground(True)
 
         layout = QHBoxLayout(content_frame)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -109,8 +246,6 @@ class DashboardWindow(QMainWindow):
 
         layout = QVBoxLayout(header_section)
 
-        self.ensure_header_buttons()
-
         header_row = QHBoxLayout()
         header_row.setContentsMargins(0, 0, 0, 10)
         header_row.setSpacing(30)
@@ -119,8 +254,7 @@ class DashboardWindow(QMainWindow):
         left_layout = QHBoxLayout(left_container)
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_layout.setSpacing(0)
-        if self.top_logout_btn:
-            left_layout.addWidget(self.top_logout_btn, 0, Qt.AlignmentFlag.AlignLeft)
+        left_layout.addWidget(self.top_logout_btn, 0, Qt.AlignmentFlag.AlignLeft)
         left_layout.addStretch()
         header_row.addWidget(left_container, 0)
 
@@ -131,14 +265,9 @@ class DashboardWindow(QMainWindow):
 
         welcome_label = QLabel("Selamat Datang di ID Card Photo Machine")
         welcome_label.setObjectName("WelcomeTitleLabel")
+        welcome_label.setTextFormat(Qt.TextFormat.PlainText)
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        welcome_label.setFont(QFont("Helvetica", 28, QFont.Weight.Bold))
-        welcome_label.setStyleSheet("""
-            QLabel {
-                color: #E60012;
-                margin-bottom: 6px;
-            }
-        """)
+        welcome_label.setFont(heading_large())
 
         center_layout.addWidget(welcome_label, 0, Qt.AlignmentFlag.AlignCenter)
         header_row.addWidget(center_widget, 1)
@@ -148,266 +277,227 @@ class DashboardWindow(QMainWindow):
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(0)
         right_layout.addStretch()
-        if self.top_start_btn:
-            right_layout.addWidget(self.top_start_btn, 0, Qt.AlignmentFlag.AlignRight)
+        right_layout.addWidget(self.top_start_btn, 0, Qt.AlignmentFlag.AlignRight)
         header_row.addWidget(right_container, 0)
 
         layout.addLayout(header_row)
 
         return header_section
 
-    def ensure_header_buttons(self):
-        """Create styled header buttons if not already created"""
-        if not self.top_logout_btn:
-            self.top_logout_btn = QPushButton("Keluar")
-            self.top_logout_btn.setFixedHeight(48)
-            self.top_logout_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2c3e50;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 24px;
-                    padding: 12px 28px;
-                    font-size: 16px;
-                    font-weight: bold;
-                    min-width: 180px;
-                }
-                QPushButton:hover {
-                    background-color: #1f2a36;
-                }
-                QPushButton:disabled {
-                    background-color: #95a5a6;
-                }
-            """)
-
-        if not self.top_start_btn:
-            self.top_start_btn = QPushButton("Mulai Foto")
-            self.top_start_btn.setFixedHeight(48)
-            self.top_start_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-            self.top_start_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #E60012;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 24px;
-                    padding: 12px 28px;
-                    font-size: 16px;
-                    font-weight: bold;
-                    min-width: 180px;
-                }
-                QPushButton:hover {
-                    background-color: #c2000f;
-                }
-                QPushButton:disabled {
-                    background-color: #f5b7b1;
-                    color: #ffffff;
-                }
-            """)
-
-    def connect_signals(self):
-        """Connect component signals"""
-        if self.top_start_btn:
-            self.top_start_btn.clicked.connect(self.start_photo_capture_clicked)
-        if self.top_logout_btn:
-            self.top_logout_btn.clicked.connect(self.logout)
+    @cached_property
+    def top_logout_btn(self):
+        """Logout button, built and wired on first access"""
+        button = QPushButton("Keluar")
+        button.setFixedHeight(48)
+        button.setObjectName("DashboardLogoutButton")
+        button.clicked.connect(self.logout)
+        return button
+
+    @cached_property
+    def top_start_btn(self):
+        """Start photo button, built and wired on first access"""
+        button = QPushButton("Mulai Foto")
+        button.setFixedHeight(48)
+        button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        button.setObjectName("PrimaryStartButton")
+        button.clicked.connect(self.start_photo_capture_clicked)
+        return button
+
+    def _build_message_dialog(self, title, message):
+        """Create a message dialog for the start button flow"""
+        from ui.dialogs.custom_dialog import CustomStyledDialog
+        return CustomStyledDialog(self, title, message)
+
+    # Message dialogs are built on first use and reused for later clicks
+    @cached_property
+    def _no_user_dialog(self):
+        return self._build_message_dialog(_NO_USER_TITLE, _NO_USER_MESSAGE)
+
+    @cached_property
+    def _request_sent_dialog(self):
+        return self._build_message_dialog(_REQUEST_SENT_TITLE, _REQUEST_SENT_MESSAGE)
+
+    @cached_property
+    def _request_load_failed_dialog(self):
+        return self._build_message_dialog(_REQUEST_LOAD_FAILED_TITLE, _REQUEST_LOAD_FAILED_MESSAGE)
+
+    @cached_property
+    def _logout_dialog(self):
+        from ui.dialogs.custom_dialog import CustomStyledDialog
+        dialog = CustomStyledDialog(
+            self,
+            _LOGOUT_TITLE,
+            _LOGOUT_MESSAGE,
+            buttons=[("Batal", QDialog.DialogCode.Rejected), ("Keluar", QDialog.DialogCode.Accepted)],
+            custom_size=(350, 150),
+        )
+        dialog.set_cancel_button(0)
+        return dialog
 
     def set_session_info(self, user_data):
         """Set user session information"""
+        self._cancel_pending_request()
         self.current_user = user_data
+        self._latest_request_cache.clear()
         self.update_user_info()
 
+    def _cancel_pending_request(self):
+        """Forget an in-flight latest-request lookup so its result is dropped when it arrives"""
+        if self._pending_request is not None:
+            self._pending_request = None
+            self.top_start_btn.setEnabled(True)
+
+    def _get_user(self):
+        """Return the current user, falling back to the session manager until one is set"""
+        if self.current_user is None:
+            self.current_user = session_manager.get_current_user()
+        return self.current_user
+
     def update_user_info(self):
         """Update user information display"""
-        if self.current_user:
-            self.user_info_section.update_user_info(self.current_user)
-        else:
-            # Try to get from session manager
-            current_user = session_manager.get_current_user()
-            if current_user:
-                self.current_user = current_user
-                self.user_info_section.update_user_info(current_user)
-            else:
-                self.user_info_section.update_user_info(None)
-
+        user = self._get_user()
+        # The user info labels only exist once the deferred content section is built
+        if self._content_built:
+            self.user_info_section.update_user_info(user)
+
+    def showEvent(self, event):
+        # A request may have been answered while the dashboard was hidden
+        self._latest_request_cache.clear()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Logout only hides the dashboard; a late lookup result must not open a dialog then
+        self._cancel_pending_request()
+        super().hideEvent(event)
+
+    def _cached_latest_request(self, cache_key):
+        """Return (True, request) for a recent lookup of cache_key, otherwise (False, None)"""
+        cached = self._latest_request_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _LATEST_REQUEST_TTL:
+            return True, cached[1]
+        return False, None
+
+    def invalidate_request_cache(self, npk):
+        """Drop cached latest-request lookups for npk, e.g. after it sent a new request"""
+        for cache_key in [key for key in self._latest_request_cache if key[0] == npk]:
+            del self._latest_request_cache[cache_key]
+
+    @pyqtSlot()
     def start_photo_capture_clicked(self):
         """Handle start photo capture button click"""
-        user = self.current_user or session_manager.get_current_user()
+        # Ignore further clicks until this one has been handled
+        self.top_start_btn.setEnabled(False)
+        pending = False
+        try:
+            pending = self._start_photo_capture()
+        finally:
+            # A pending lookup re-enables the button once its result arrives
+            if not pending:
+                self.top_start_btn.setEnabled(True)
+
+    def _start_photo_capture(self):
+        """Start the capture or the request flow; return True while a lookup is still pending"""
+        user = self._get_user()
 
         if not user:
-            dialog = CustomStyledDialog(
-                self,
-                "Pengguna Tidak Ditemukan",
-                "Tidak ada pengguna yang sedang login. Silakan login kembali."
-            )
-            dialog.exec()
-            return
+            self._no_user_dialog.exec()
+            return False
 
         last_take_photo = user.get('last_take_photo')
         last_take_dt = parse_datetime(last_take_photo)
 
         if not last_take_dt or datetime.now() - last_take_dt >= timedelta(days=365):
             self.start_photo_capture.emit()
-            return
+            return False
 
         # Get the latest request for the user
         npk = user.get('npk')
-        if npk:
-            latest_request = db_manager.get_latest_request(npk)
-            if latest_request:
-                status = latest_request.get('status', '')
-                if status == 'requested':
-                    # Show details only for requested status
-                    request_dialog = RequestDialog(self, user, latest_request)
-                    request_dialog.exec()
-                    return
-                elif status == 'rejected':
-                    # Show details + form for rejected status
-                    request_dialog = RequestDialog(self, user, latest_request)
-                    if request_dialog.exec() == QDialog.DialogCode.Accepted:
-                        confirm_dialog = CustomStyledDialog(
-                            self,
-                            "Permintaan Terkirim",
-                            "Permintaan Anda telah dikirim ke admin untuk ditinjau."
-                        )
-                        confirm_dialog.exec()
-                    return
+        if not npk:
+            self._show_request_flow(user, None, last_take_dt)
+            return False
+
+        cache_key = (npk, last_take_photo)
+        found, latest_request = self._cached_latest_request(cache_key)
+        if found:
+            self._show_request_flow(user, latest_request, last_take_dt)
+            return False
+
+        # Query the database off the GUI thread and continue in _on_latest_request_loaded
+        self._request_token += 1
+        self._pending_request = (self._request_token, user, cache_key, last_take_dt)
+        QThreadPool.globalInstance().start(
+            LatestRequestFetcher(npk, self._request_token, self._latest_request_signals)
+        )
+        return True
+
+    def _take_pending_request(self, token):
+        """Return and clear the pending lookup if token belongs to it, otherwise None"""
+        pending = self._pending_request
+        if pending is None or pending[0] != token:
+            return None
+        self._pending_request = None
+        return pending
+
+    @pyqtSlot(int, object)
+    def _on_latest_request_loaded(self, token, latest_request):
+        """Continue the request flow once the latest request has been fetched"""
+        pending = self._take_pending_request(token)
+        if pending is None:
+            # Cancelled by a logout, a session change or a hide while the lookup ran
+            return
+        _, user, cache_key, last_take_dt = pending
+        self._latest_request_cache[cache_key] = (time.monotonic(), latest_request)
+        try:
+            self._show_request_flow(user, latest_request, last_take_dt)
+        finally:
+            self.top_start_btn.setEnabled(True)
+
+    @pyqtSlot(int)
+    def _on_latest_request_failed(self, token):
+        """Tell the user the latest request could not be loaded"""
+        if self._take_pending_request(token) is None:
+            return
+        try:
+            self._request_load_failed_dialog.exec()
+        finally:
+            self.top_start_btn.setEnabled(True)
+
+    def _show_request_flow(self, user, latest_request, last_take_dt):
+        """Show request details and/or the request form; last_take_dt is the parsed last photo date"""
+        # The request dialog is only needed once the button is pressed, so load it on demand
+        from ui.dialogs.request_dialog import RequestDialog
+
+        if latest_request:
+            status = latest_request.get('status', '')
+            if status == 'requested':
+                # Show details only for requested status
+                request_dialog = RequestDialog(self, user, latest_request)
+                request_dialog.exec()
+                return
+            elif status == 'rejected':
+                # Show details + form for rejected status
+                request_dialog = RequestDialog(self, user, latest_request)
+                if request_dialog.exec() == QDialog.DialogCode.Accepted:
+                    self.invalidate_request_cache(user.get('npk'))
+                    self._request_sent_dialog.exec()
+                return
 
         # No request or approved request, show form only
-        request_dialog = RequestDialog(self, user, None)
+        request_dialog = RequestDialog(self, user, None, last_take_dt)
         if request_dialog.exec() == QDialog.DialogCode.Accepted:
-            confirm_dialog = CustomStyledDialog(
-                self,
-                "Permintaan Terkirim",
-                "Permintaan Anda telah dikirim ke admin untuk ditinjau."
-            )
-            confirm_dialog.exec()
+            self.invalidate_request_cache(user.get('npk'))
+            self._request_sent_dialog.exec()
 
+    @pyqtSlot()
     def logout(self):
         """Handle logout request"""
-        # Create custom styled dialog
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Konfirmasi Keluar")
-        dialog.setFixedSize(350, 150)
-        dialog.setModal(True)
-
-        # Set white background and dark text
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-                color: #333333;
-            }
-            QLabel {
-                background-color: #FFFFFF;
-                color: #333333;
-                font-size: 14px;
-                padding: 10px;
-            }
-            QPushButton {
-                background-color: #E60012;
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #CC0010;
-            }
-            QPushButton:pressed {
-                background-color: #99000C;
-            }
-            QPushButton#cancelButton {
-                background-color: #6c757d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton#cancelButton:pressed {
-                background-color: #495057;
-            }
-        """)
-
-        # Layout
-        layout = QVBoxLayout(dialog)
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(15)
-
-        # Message label
-        message_label = QLabel("Apakah Anda yakin ingin logout?")
-        message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(message_label)
-
-        # Button layout
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
-
-        # Cancel button
-        cancel_btn = QPushButton("Batal")
-        cancel_btn.setObjectName("cancelButton")
-        cancel_btn.clicked.connect(dialog.reject)
-        button_layout.addWidget(cancel_btn)
-
-        # Logout button
-        logout_btn = QPushButton("Keluar")
-        logout_btn.clicked.connect(dialog.accept)
-        button_layout.addWidget(logout_btn)
-
-        layout.addLayout(button_layout)
-
-        # Show dialog and handle result
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        if self._logout_dialog.exec() == QDialog.DialogCode.Accepted:
             # Emit signal to main app to handle logout
             self.logout_requested.emit()
 
     def apply_modern_style(self):
         """Apply modern styling to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f6fa;
-            }
-            QFrame {
-                background-color: white;
-                border-radius: 10px;
-                margin: 5px;
-                padding: 10px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                font-size: 14px;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 10px 0 10px;
-                background-color: #f5f6fa;
-            }
-            QPushButton {
-                background-color: #34495e;
-                color: white;
-                font-weight: bold;
-                border: none;
-                padding: 10px;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #2c3e50;
-            }
-            QPushButton:pressed {
-                background-color: #1b2631;
-            }
-            QLabel {
-                color: #2c3e50;
-                background-color: transparent;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
 
     def closeEvent(self, event):
         """Handle window close event"""
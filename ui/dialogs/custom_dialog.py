@@ -2,7 +2,47 @@
 Custom styled dialog with consistent styling
 """
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
+
+
+# Shared by every dialog instance; the #cancelButton rules cover set_cancel_button
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #FFFFFF;
+        color: #333333;
+    }
+    QLabel {
+        background-color: #FFFFFF;
+        color: #333333;
+        font-size: 14px;
+        padding: 10px;
+    }
+    QPushButton {
+        background-color: #E60012;
+        color: #FFFFFF;
+        font-weight: bold;
+        font-size: 14px;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #CC0010;
+    }
+    QPushButton:pressed {
+        background-color: #99000C;
+    }
+    QPushButton#cancelButton {
+        background-color: #6c757d;
+    }
+    QPushButton#cancelButton:hover {
+        background-color: #5a6268;
+    }
+    QPushButton#cancelButton:pressed {
+        background-color: #495057;
+    }
+"""
 
 
 class CustomStyledDialog(QDialog):
@@ -35,56 +75,28 @@ class CustomStyledDialog(QDialog):
             buttons = [("OK", QDialog.DialogCode.Accepted)]
 
         self.buttons = []
+        # One bound slot serves every button; the clicked button's role is looked up by sender
+        self._button_roles = {}
         for text, role in buttons:
             btn = QPushButton(text)
-            btn.clicked.connect(lambda checked, r=role: self.done(r))
+            self._button_roles[btn] = role
+            btn.clicked.connect(self._on_button_clicked)
             button_layout.addWidget(btn)
             self.buttons.append(btn)
 
         layout.addLayout(button_layout)
 
         # Apply consistent styling FIRST
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-                color: #333333;
-            }
-            QLabel {
-                background-color: #FFFFFF;
-                color: #333333;
-                font-size: 14px;
-                padding: 10px;
-            }
-            QPushButton {
-                background-color: #E60012;
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #CC0010;
-            }
-            QPushButton:pressed {
-                background-color: #99000C;
-            }
-            QPushButton#cancelButton {
-                background-color: #6c757d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton#cancelButton:pressed {
-                background-color: #495057;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
         # Set size - either custom or auto-adjust based on content
         if custom_size:
-            self.setFixedSize(custom_size[0], custom_size[1])
+            # Width is pinned to a range; the layout settles the height in one pass
+            self.setSizeGripEnabled(False)
+            self.setMinimumWidth(custom_size[0])
+            self.setMaximumWidth(max(custom_size[0], 640))
+            self.setMinimumHeight(custom_size[1])
+            self.adjustSize()
         else:
             # Force layout update after stylesheet is applied
             self.layout().update()
@@ -104,6 +116,11 @@ class CustomStyledDialog(QDialog):
             height = max(min_height, min(max_height, current_size.height()))
             self.resize(width, height)
 
+    @pyqtSlot()
+    def _on_button_clicked(self):
+        """Close the dialog with the role of the button that was clicked"""
+        self.done(self._button_roles[self.sender()])
+
     def showEvent(self, event):
         """Override showEvent to ensure proper sizing when dialog is shown"""
         super().showEvent(event)
@@ -115,23 +132,8 @@ class CustomStyledDialog(QDialog):
     def set_cancel_button(self, button_index=0):
         """Set a button as cancel button for different styling"""
         if 0 <= button_index < len(self.buttons):
-            self.buttons[button_index].setObjectName("cancelButton")
-            # Force stylesheet update to apply the cancel button styling
-            self.buttons[button_index].setStyleSheet("""
-                QPushButton#cancelButton {
-                    background-color: #6c757d;
-                    color: #FFFFFF;
-                    font-weight: bold;
-                    font-size: 14px;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 20px;
-                    min-width: 80px;
-                }
-                QPushButton#cancelButton:hover {
-                    background-color: #5a6268;
-                }
-                QPushButton#cancelButton:pressed {
-                    background-color: #495057;
-                }
-            """)
+            button = self.buttons[button_index]
+            button.setObjectName("cancelButton")
+            # Re-polish so the dialog sheet's #cancelButton rules pick up the new name
+            button.style().unpolish(button)
+            button.style().polish(button)
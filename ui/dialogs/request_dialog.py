@@ -4,18 +4,60 @@ Request dialog for showing request details and form based on status
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QTextEdit, QSizePolicy
 from PyQt6.QtCore import Qt
 from datetime import datetime
+from functools import cached_property
 from utils.datetime_utils import parse_datetime, days_since, format_datetime_for_display
-from utils.ui_utils import create_dialog_styles, create_standard_button_styles, create_frame_styles, create_text_edit_styles
+from utils.ui_utils import (create_dialog_styles, create_standard_button_styles, create_frame_styles,
+                            create_text_edit_styles, minify_stylesheet)
 from modules.database import db_manager
 
 
+# Built once at import; the explanation label rules replace their per-label sheets
+_REQUEST_DIALOG_QSS = minify_stylesheet(
+    create_dialog_styles() + create_standard_button_styles() +
+    create_frame_styles() + create_text_edit_styles() + """
+        QLabel#ExplanationTitle {
+            font-size: 16px;
+            font-weight: bold;
+            color: #856404;
+            margin-bottom: 5px;
+        }
+        QLabel#ExplanationText {
+            color: #856404;
+            font-size: 14px;
+            line-height: 1.4;
+        }
+    """
+)
+
+_EXPLANATION_TEXT = (
+    "Foto terakhir Anda diambil pada {taken} ({days} hari yang lalu). "
+    "Menurut kebijakan perusahaan, Anda hanya dapat mengambil foto ID baru sekali dalam setahun. "
+    "Karena foto terakhir Anda diambil kurang dari setahun yang lalu, "
+    "Anda perlu meminta izin dari administrator untuk mengambil foto baru. "
+    "Silakan berikan alasan yang valid untuk permintaan Anda di bawah ini."
+)
+
+# Status -> (label text, color); unknown statuses are shown as pending
+_STATUS_MAP = {
+    'approved': ("Disetujui", "#28a745"),
+    'rejected': ("Ditolak", "#dc3545"),
+    'requested': ("Menunggu", "#ffc107"),
+}
+
+_TIME_HTML = "<b>Time:</b> {}"
+_STATUS_HTML = "<b>Status:</b> <span style='color: {color};'>{text}</span>"
+_DESCRIPTION_HTML = "<b>Description:</b> {}"
+_REMARKS_HTML = "<b>Remarks:</b> {}"
+
+
 class RequestDialog(QDialog):
     """Unified dialog for showing request details and form based on status"""
 
-    def __init__(self, parent=None, user=None, request_data=None):
+    def __init__(self, parent=None, user=None, request_data=None, last_take_dt=None):
         super().__init__(parent)
         self.user = user or {}
         self.request_data = request_data or {}
+        self.last_take_dt = last_take_dt
         self.setWindowTitle("Formulir Permintaan")
         self.setModal(True)
 
@@ -66,69 +108,50 @@ class RequestDialog(QDialog):
         layout.addLayout(button_layout)
 
         # Apply styling
-        self.setStyleSheet(create_dialog_styles() + create_standard_button_styles() +
-                          create_frame_styles() + create_text_edit_styles())
+        self.setStyleSheet(_REQUEST_DIALOG_QSS)
 
-        # Dynamic sizing based on content
+        # Dynamic sizing based on content; adjustSize polishes the tree first, so this one
+        # pass is final and QDialog centers the dialog on its parent at the right size
         self._adjust_dialog_size()
 
     def _add_explanation_section(self, layout):
         """Add explanation section for why user needs to request permission"""
         # Only show explanation if there's no existing request
-        if not self.request_data:
-            # Check if user's last photo was less than 1 year ago
-            last_take_photo = self.user.get('last_take_photo')
-            if last_take_photo:
-                try:
-                    last_take_dt = parse_datetime(last_take_photo)
-                    if last_take_dt:
-                        days_ago = days_since(last_take_dt)
-                        if days_ago < 365:
-                            # Create explanation frame
-                            explanation_frame = QFrame()
-                            explanation_frame.setObjectName("ExplanationFrame")
-
-                            explanation_layout = QVBoxLayout(explanation_frame)
-                            explanation_layout.setSpacing(8)
-
-                            # Title
-                            title_label = QLabel("Perlu Izin untuk Mengambil Foto Baru")
-                            title_label.setStyleSheet("""
-                                QLabel {
-                                    font-size: 16px;
-                                    font-weight: bold;
-                                    color: #856404;
-                                    margin-bottom: 5px;
-                                }
-                            """)
-                            explanation_layout.addWidget(title_label)
-
-                            # Explanation text
-                            explanation_text = f"""
-                            Foto terakhir Anda diambil pada {format_datetime_for_display(last_take_dt)} ({days_ago} hari yang lalu). Menurut kebijakan perusahaan, Anda hanya dapat mengambil foto ID baru sekali dalam setahun. Karena foto terakhir Anda diambil kurang dari setahun yang lalu, Anda perlu meminta izin dari administrator untuk mengambil foto baru. Silakan berikan alasan yang valid untuk permintaan Anda di bawah ini.
-                            """
-
-                            explanation_label = QLabel(explanation_text.strip())
-                            explanation_label.setWordWrap(True)
-                            explanation_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-                            explanation_label.setStyleSheet("""
-                                QLabel {
-                                    color: #856404;
-                                    font-size: 14px;
-                                    line-height: 1.4;
-                                }
-                            """)
-                            explanation_layout.addWidget(explanation_label)
-
-                            layout.addWidget(explanation_frame)
-                except:
-                    pass
-
-    def showEvent(self, event):
-        """Override showEvent to ensure proper sizing when dialog is shown"""
-        super().showEvent(event)
-        # Re-adjust size after the dialog is fully shown
-        self._adjust_dialog_size()
+        if self.request_data:
+            return
+        # Check if user's last photo was less than 1 year ago; callers may pass it already parsed
+        last_take_dt = self.last_take_dt or parse_datetime(self.user.get('last_take_photo'))
+        if not last_take_dt:
+            return
+        days_ago = days_since(last_take_dt)
+        if days_ago >= 365:
+            return
+
+        # Create explanation frame
+        explanation_frame = QFrame()
+        explanation_frame.setObjectName("ExplanationFrame")
+
+        explanation_layout = QVBoxLayout(explanation_frame)
+        explanation_layout.setSpacing(8)
+
+        # Title
+        title_label = QLabel("Perlu Izin untuk Mengambil Foto Baru")
+        title_label.setObjectName("ExplanationTitle")
+        explanation_layout.addWidget(title_label)
+
+        # Explanation text
+        explanation_text = _EXPLANATION_TEXT.format(
+            taken=format_datetime_for_display(last_take_dt),
+            days=days_ago,
+        )
+
+        explanation_label = QLabel(explanation_text)
+        explanation_label.setWordWrap(True)
+        explanation_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        explanation_label.setObjectName("ExplanationText")
+        explanation_layout.addWidget(explanation_label)
+
+        layout.addWidget(explanation_frame)
 
     def _add_details_section(self, layout):
         """Add the details section showing last request info"""
@@ -152,30 +175,23 @@ class RequestDialog(QDialog):
             try:
                 dt = datetime.fromisoformat(request_time.replace('Z', '+00:00'))
                 formatted_time = format_datetime_for_display(dt)
-            except:
+            except (ValueError, AttributeError):
+                # Not an ISO string; show the stored value as is
                 formatted_time = request_time
-            time_label = QLabel(f"<b>Time:</b> {formatted_time}")
+            time_label = QLabel(_TIME_HTML.format(formatted_time))
             details_layout.addWidget(time_label)
 
         # Status
         status = self.request_data.get('status', 'requested')
-        if status == 'approved':
-            status_text = "Disetujui"
-            status_color = "#28a745"
-        elif status == 'rejected':
-            status_text = "Ditolak"
-            status_color = "#dc3545"
-        else:
-            status_text = "Menunggu"
-            status_color = "#ffc107"
+        status_text, status_color = _STATUS_MAP.get(status, _STATUS_MAP['requested'])
 
-        status_label = QLabel(f"<b>Status:</b> <span style='color: {status_color};'>{status_text}</span>")
+        status_label = QLabel(_STATUS_HTML.format(text=status_text, color=status_color))
         details_layout.addWidget(status_label)
 
         # Request Description
         request_desc = self.request_data.get('request_desc', '')
         if request_desc:
-            desc_label = QLabel(f"<b>Description:</b> {request_desc}")
+            desc_label = QLabel(_DESCRIPTION_HTML.format(request_desc))
             desc_label.setWordWrap(True)
             desc_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
             details_layout.addWidget(desc_label)
@@ -183,7 +199,7 @@ class RequestDialog(QDialog):
         # Remarks
         remark = self.request_data.get('remark', '')
         if remark:
-            remark_label = QLabel(f"<b>Remarks:</b> {remark}")
+            remark_label = QLabel(_REMARKS_HTML.format(remark))
             remark_label.setWordWrap(True)
             remark_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
             details_layout.addWidget(remark_label)
@@ -250,36 +266,41 @@ class RequestDialog(QDialog):
         if self.height() > screen.height():
             self.resize(self.width(), screen.height() - 50)
 
-    def _handle_send(self):
-        """Handle send request button click"""
+    @cached_property
+    def _message_dialog(self):
+        """One message dialog reused for every send error, retitled per message"""
         from ui.dialogs.custom_dialog import CustomStyledDialog
+        return CustomStyledDialog(self)
+
+    def _show_message(self, title, message):
+        """Show a message in the reused dialog"""
+        dialog = self._message_dialog
+        dialog.setWindowTitle(title)
+        dialog.message_label.setText(message)
+        dialog.exec()
 
+    def _handle_send(self):
+        """Handle send request button click"""
         reason = self.reason_input.toPlainText().strip()
         if not reason:
-            dialog = CustomStyledDialog(
-                self,
+            self._show_message(
                 "Alasan Dibutuhkan",
                 "Silakan isi alasan permintaan sebelum mengirim."
             )
-            dialog.exec()
             return
 
         npk = self.user.get('npk')
         if not npk:
-            dialog = CustomStyledDialog(
-                self,
+            self._show_message(
                 "Data Pengguna Tidak Lengkap",
                 "Tidak dapat mengirim permintaan karena data pengguna tidak lengkap."
             )
-            dialog.exec()
             return
 
         if db_manager.add_request_history(npk, reason):
             self.accept()
         else:
-            dialog = CustomStyledDialog(
-                self,
+            self._show_message(
                 "Gagal Mengirim",
                 "Permintaan tidak dapat dikirim saat ini. Silakan coba lagi."
             )
-            dialog.exec()
@@ -2,7 +2,7 @@ import sys
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QGridLayout,
                              QLabel, QLineEdit, QPushButton, QMessageBox, QFrame, QDialog, QHBoxLayout)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from ui.components._fonts import body_large, heading_xlarge, subheading
 from modules.database import db_manager
 from ui.dialogs.custom_dialog import CustomStyledDialog
 
@@ -18,7 +18,7 @@ class LoginPage(QWidget):
         super().__init__(parent)
         self.current_user = None
         self._fullscreen_initialized = False
-        self._base_font = QFont("Helvetica", 22)
+        self._base_font = body_large()
         self.setFont(self._base_font)
         self.init_ui()
 
@@ -47,14 +47,14 @@ class LoginPage(QWidget):
 
         # Judul
         title = QLabel("Selamat Datang")
-        title.setFont(QFont("Helvetica", 32, QFont.Weight.Bold))
+        title.setFont(heading_xlarge())
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title.setObjectName("TitleLabel")
         container_layout.addWidget(title)
 
         # Sub-judul
         subtitle = QLabel("Silakan login untuk melanjutkan")
-        subtitle.setFont(QFont("Helvetica", 18))
+        subtitle.setFont(subheading())
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         subtitle.setObjectName("SubtitleLabel")
         container_layout.addWidget(subtitle)
@@ -2,11 +2,12 @@ from PyQt6.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
     QHBoxLayout, QSizePolicy
 )
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import Qt, pyqtSignal
 import sys
 from config import APP_NAME, APP_VERSION, UI_SETTINGS
 from ui.admin_window import AdminWindow
+from ui.components._fonts import body_large
 
 from modules.session_manager import session_manager
 
@@ -20,7 +21,7 @@ class RoleSelectionWindow(QWidget):
         self.admin_window = None
         self.current_user = session_manager.get_current_user()  # ambil user aktif
         self._fullscreen_initialized = False
-        self._base_font = QFont("Helvetica", 22)
+        self._base_font = body_large()
         self.setFont(self._base_font)
         self.init_ui()
 
@@ -2,6 +2,7 @@
 Datetime utility functions
 """
 from datetime import datetime
+from functools import lru_cache
 
 
 def parse_datetime(value):
@@ -11,14 +12,22 @@ def parse_datetime(value):
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError:
-            for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
+        return _parse_datetime_str(value)
+    return None
+
+
+# datetimes are immutable, so a cached result can be handed to every caller
+@lru_cache(maxsize=256)
+def _parse_datetime_str(value):
+    """Parse a datetime string, falling back to strptime for non-ISO formats"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
     return None
 
 
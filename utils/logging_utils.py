@@ -0,0 +1,38 @@
+"""
+Logging Utilities
+Routes log records through a queue so the UI thread never blocks on log output
+"""
+import logging
+import logging.handlers
+import queue
+from config import LOG_FILE
+
+_queue_listener = None
+
+
+def setup_logging():
+    """Move the root handlers behind a QueueHandler drained by a background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:] + [file_handler]
+    log_queue = queue.SimpleQueue()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    if root_logger.level == logging.NOTSET or root_logger.level > logging.INFO:
+        root_logger.setLevel(logging.INFO)
+
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
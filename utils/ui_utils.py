@@ -1,8 +1,38 @@
 """
 UI utility functions and common styling
 """
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import Qt
+import logging
+import os
+import re
+from PyQt6.QtCore import QFile, QIODevice
+from config import STYLES_DIR
+
+logger = logging.getLogger(__name__)
+
+_stylesheet_cache = {}
+
+
+def load_stylesheet(filename):
+    """Load a QSS file from assets/styles, reading it from disk only once"""
+    stylesheet = _stylesheet_cache.get(filename)
+    if stylesheet is None:
+        qss_file = QFile(os.path.join(STYLES_DIR, filename))
+        if qss_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+            try:
+                stylesheet = bytes(qss_file.readAll()).decode("utf-8")
+            finally:
+                qss_file.close()
+        else:
+            logger.warning("Stylesheet tidak ditemukan: %s", filename)
+            stylesheet = ""
+        _stylesheet_cache[filename] = stylesheet
+    return stylesheet
+
+
+def minify_stylesheet(stylesheet):
+    """Collapse whitespace and drop comments so Qt's QSS lexer sees fewer tokens"""
+    stylesheet = re.sub(r"/\*.*?\*/", "", stylesheet, flags=re.S)
+    return re.sub(r"\s+", " ", stylesheet).strip()
 
 
 def create_standard_button_styles():